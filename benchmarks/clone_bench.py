@@ -0,0 +1,58 @@
+"""Compare the fast clone paths with copy.deepcopy.
+
+    python benchmarks/clone_bench.py          # lab1 and lab3
+    python benchmarks/clone_bench.py lab3
+"""
+import copy
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NUMBER = 100_000
+
+
+def _report(label: str, fast: float, slow: float) -> None:
+    print(f"{label:<36} clone {fast / NUMBER * 1e9:8.0f} ns   deepcopy {slow / NUMBER * 1e9:8.0f} ns   x{slow / fast:.1f}")
+
+
+def bench_lab1() -> None:
+    from domain.prototype.character_prototype import BaseCharacter
+
+    goblin = BaseCharacter("Goblin", "Enemy", "Club", 40, 20)
+    _report("lab1 BaseCharacter.clone",
+            timeit.timeit(goblin.clone, number=NUMBER),
+            timeit.timeit(lambda: copy.deepcopy(goblin), number=NUMBER))
+
+
+def bench_lab3() -> None:
+    from domain.models import Character
+    from domain.prototype import CharacterPrototypeManager
+
+    ch = Character("Hero", 120, 33, 8)
+    _report("lab3 Character.clone",
+            timeit.timeit(ch.clone, number=NUMBER),
+            timeit.timeit(lambda: copy.deepcopy(ch), number=NUMBER))
+
+    prototypes = CharacterPrototypeManager()
+    _report("lab3 get_template(copy_on_write)",
+            timeit.timeit(lambda: prototypes.get_template("warrior", copy_on_write=True), number=NUMBER),
+            timeit.timeit(lambda: copy.deepcopy(prototypes.peek_template("warrior")), number=NUMBER))
+    _report("lab3 peek_template",
+            timeit.timeit(lambda: prototypes.peek_template("warrior"), number=NUMBER),
+            timeit.timeit(lambda: copy.deepcopy(prototypes.peek_template("warrior")), number=NUMBER))
+
+
+BENCHES = {"lab1": bench_lab1, "lab3": bench_lab3}
+
+
+if __name__ == "__main__":
+    labs = sys.argv[1:] or list(BENCHES)
+    if len(labs) > 1:
+        # Every lab has its own top-level "domain" package, so each runs in its own process.
+        for lab in labs:
+            subprocess.run([sys.executable, __file__, lab], check=True)
+    else:
+        sys.path.insert(0, os.path.join(ROOT, labs[0]))
+        BENCHES[labs[0]]()
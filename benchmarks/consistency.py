@@ -0,0 +1,144 @@
+"""Randomized cross-checks of lab3's fast battle paths against their reference loops.
+
+    python benchmarks/consistency.py
+    python benchmarks/consistency.py --cases 2000 --seed 7
+
+Covers the closed-form duel solver, binary replays, the initiative scheduler
+and the vectorized raid. Exits with status 1 and prints the failing case when
+any check disagrees.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+from fractions import Fraction
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "lab3"))
+
+from domain.decorator import AttackBoost, ShieldBoost, compile_chain  # noqa: E402
+from domain.models import Character  # noqa: E402
+from domain.simulation import (  # noqa: E402
+    BattleReplay, InitiativeScheduler, record_battle, run_initiative_battle, run_raid,
+)
+from domain.simulation.replay import _fighter_header  # noqa: E402
+from domain.singleton import run_headless_battle, run_realtime_battle_async, solve_battle  # noqa: E402
+
+
+def solver_matches_simulation(ch1, ch2) -> bool:
+    return solve_battle(ch1, ch2) == run_headless_battle(ch1.clone(), ch2.clone())
+
+
+def replay_matches_realtime(ch1, ch2) -> bool:
+    # A replay must decode to the fighters it was recorded from and replay the
+    # live battle frame for frame, both played in order and scrubbed by index.
+    replay = BattleReplay(record_battle(ch1, ch2))
+    if replay.fighters != (_fighter_header(ch1), _fighter_header(ch2)):
+        return False
+
+    live = []
+    asyncio.run(run_realtime_battle_async(ch1.clone(), ch2.clone(), lambda *frame: live.append(frame), 0))
+    played = []
+    replay.play(lambda *frame: played.append(frame), speed=0)
+    return played == live and [replay.frame(i) for i in reversed(range(len(replay)))] == live[::-1]
+
+
+def scheduler_matches_reference(speeds, actions: int) -> bool:
+    # Reference order: every (exact action time, index) pair sorted, so ties
+    # between equal times must go to the lower index.
+    scheduler = InitiativeScheduler(speeds)
+    expected = sorted(
+        (Fraction(count, s), index)
+        for index, s in enumerate(speeds) if s > 0
+        for count in range(1, actions + 1)
+    )[:actions]
+    return [scheduler.next() for _ in expected] == [index for _, index in expected]
+
+
+def initiative_matches_headless(ch1, ch2) -> bool:
+    # Two fighters without speed must replay the classic alternating duel.
+    duel = run_headless_battle(ch1.clone(), ch2.clone())
+    result = run_initiative_battle([ch1.clone(), ch2.clone()], teams=[1, 2], use_speed=False)
+    return (duel.winner_slot, duel.turns, [duel.hp1, duel.hp2]) == (
+        result.winner_team or 0, result.actions, result.final_hp)
+
+
+def raid_matches_reference(team_a, team_b, targeting: str = "spread",
+                           max_ticks: int = 10_000) -> bool:
+    # Per-object reference: clones take every hit of a tick through take_damage.
+    a = [ch.clone() for ch in team_a]
+    b = [ch.clone() for ch in team_b]
+    ticks = 0
+    while ticks < max_ticks:
+        living_a = [ch for ch in a if ch.get_health() > 0]
+        living_b = [ch for ch in b if ch.get_health() > 0]
+        if not living_a or not living_b:
+            break
+        hits = []
+        for attackers, defenders in ((living_a, living_b), (living_b, living_a)):
+            for k, attacker in enumerate(attackers):
+                target = defenders[k % len(defenders)] if targeting == "spread" else defenders[0]
+                hits.append((target, attacker.get_attack()))
+        for target, damage in hits:
+            target.take_damage(damage)
+        ticks += 1
+
+    result = run_raid(team_a, team_b, targeting, max_ticks)
+    return (result.ticks == ticks
+            and result.hp_a.tolist() == [ch.get_health() for ch in a]
+            and result.hp_b.tolist() == [ch.get_health() for ch in b])
+
+
+def fighter(rng: random.Random, name: str, buffs: bool = True):
+    ch = Character(name, rng.randint(0, 300), rng.randint(1, 30), rng.randint(1, 9))
+    if buffs and rng.random() < 0.3:
+        ch = AttackBoost(ch, rng.randint(1, 5))
+    if buffs and rng.random() < 0.2:
+        ch = ShieldBoost(ch, -rng.randint(1, 20))
+    if rng.random() < 0.3:
+        ch = compile_chain(ch)
+    return ch
+
+
+def describe(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(describe(v) for v in value) + "]"
+    if hasattr(value, "get_health"):
+        return f"{type(value).__name__}(hp={value.get_health()}, atk={value.get_attack()}, spd={value.get_speed()})"
+    return repr(value)
+
+
+def run(cases: int, seed: int) -> int:
+    rng = random.Random(seed)
+    checks = {
+        "solver": lambda: (solver_matches_simulation, (fighter(rng, "a"), fighter(rng, "b"))),
+        "replay": lambda: (replay_matches_realtime, (fighter(rng, "á"), fighter(rng, "b"))),
+        "initiative": lambda: (initiative_matches_headless, (fighter(rng, "a"), fighter(rng, "b"))),
+        "scheduler": lambda: (scheduler_matches_reference,
+                              ([rng.randint(0, 12) for _ in range(rng.randint(1, 8))], rng.randint(1, 200))),
+        "raid": lambda: (raid_matches_reference,
+                         ([fighter(rng, f"a{i}") for i in range(rng.randint(1, 20))],
+                          [fighter(rng, f"b{i}") for i in range(rng.randint(1, 20))],
+                          rng.choice(("spread", "focus")))),
+    }
+
+    failures = 0
+    for name, make in checks.items():
+        for _ in range(cases):
+            check, args = make()
+            if not check(*args):
+                failures += 1
+                print(f"{name}: mismatch for {describe(args)}")
+                break
+        else:
+            print(f"{name:<11} {cases} cases ok")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sys.exit(1 if run(args.cases, args.seed) else 0)
@@ -0,0 +1,68 @@
+"""Memory and time of mass goblin clones in lab1: the old dict-backed
+character copied with copy.deepcopy against the flyweight clone and the
+pooled spawner.
+
+    python benchmarks/flyweight_bench.py
+    python benchmarks/flyweight_bench.py 200000
+"""
+import copy
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "lab1"))
+
+from domain.prototype.character_prototype import BaseCharacter  # noqa: E402
+from domain.prototype.clone_spawner import CloneSpawner  # noqa: E402
+
+
+class LegacyCharacter:
+    # BaseCharacter as it was before the flyweight: every field in a per-instance __dict__.
+    def __init__(self, name, char_class, weapon, health, strength):
+        self.name = name
+        self.char_class = char_class
+        self.weapon = weapon
+        self.health = health
+        self.strength = strength
+
+
+def _measure(make):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    army = make()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del army
+    return size, elapsed
+
+
+def main(count):
+    legacy = LegacyCharacter("Goblin", "Enemy", "Club", 40, 20)
+    goblin = BaseCharacter("Goblin", "Enemy", "Club", 40, 20)
+
+    def spawned():
+        spawner = CloneSpawner(goblin, size=count)
+        return spawner.spawn_many(count)
+
+    cases = [
+        ("deepcopy (dict-backed)", lambda: [copy.deepcopy(legacy) for _ in range(count)]),
+        ("deepcopy (flyweight)", lambda: [copy.deepcopy(goblin) for _ in range(count)]),
+        ("BaseCharacter.clone", lambda: [goblin.clone() for _ in range(count)]),
+        ("CloneSpawner.spawn_many", spawned),
+    ]
+    baseline = None
+    print(f"{count} clones")
+    for label, make in cases:
+        size, elapsed = _measure(make)
+        baseline = baseline or size
+        print(f"{label:<26} {size / 2**20:8.2f} MiB  {size / count:6.0f} B/clone  "
+              f"x{baseline / size:4.1f}  {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
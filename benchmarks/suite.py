@@ -0,0 +1,148 @@
+"""Benchmark suite for the character pipeline and battle engine.
+
+    python benchmarks/suite.py                        # run lab2 + lab3, compare with baseline
+    python benchmarks/suite.py --save                 # run and store the results as the new baseline
+    python benchmarks/suite.py --labs lab3 --threshold 0.25
+
+Each lab runs in its own subprocess because every lab ships a top-level
+"domain" package. Results are nanoseconds per operation (best of --repeat).
+The exit status is 1 when any benchmark is slower than its baseline by more
+than the threshold.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEPTHS = (1, 8, 32)
+FANOUTS = (1, 10, 100)
+
+
+def collect_benchmarks():
+    from domain.adapter import JSONCharacterAdapter
+    from domain.builder import CharacterBuilder
+    from domain.decorator import AttackBoost
+    from domain.models import Character
+    from domain.prototype import CharacterPrototypeManager
+    from domain.singleton import GameManager
+
+    benches = {}
+
+    json_data = {"name": "Bench", "stats": {"health": 40, "attack": 18, "speed": 8}}
+    proto = CharacterPrototypeManager().get_template("warrior")
+    builder = CharacterBuilder()
+    benches["builder_pipeline"] = lambda: (
+        builder.from_adapter(JSONCharacterAdapter(json_data)).apply_prototype(proto).build()
+    )
+
+    hero = Character("Hero", 120, 33, 8)
+    benches["character_clone"] = hero.clone
+
+    for depth in DEPTHS:
+        chain = Character("Deep", 100, 10, 5)
+        for _ in range(depth):
+            chain = AttackBoost(chain, 1)
+        benches[f"decorator_getters_depth_{depth}"] = lambda chain=chain: (chain.get_attack(), chain.get_health())
+
+    manager = GameManager()
+
+    def battle():
+        manager.set_character(1, Character("A", 120, 33, 8))
+        manager.set_character(2, Character("B", 125, 35, 7))
+        manager.simulate_battle_realtime(lambda text, hp1, hp2: None, 0)
+
+    benches["battle_realtime_sleep0"] = battle
+
+    try:
+        from domain.behavioral.observer import Observer, Subject
+    except ImportError:
+        return benches
+
+    class NullObserver(Observer):
+        def update(self, event_type, data):
+            pass
+
+    payload = {"attacker": hero, "defender": hero, "damage": 1, "defender_hp": 1}
+    for fanout in FANOUTS:
+        subject = Subject()
+        for _ in range(fanout):
+            subject.attach(NullObserver())
+        benches[f"subject_notify_fanout_{fanout}"] = lambda subject=subject: subject.notify("attack", payload)
+
+    return benches
+
+
+def run_lab(repeat: int) -> dict:
+    results = {}
+    for name, fn in collect_benchmarks().items():
+        timer = timeit.Timer(fn)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat, number))
+        results[name] = best / number * 1e9
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for lab, benches in results.items():
+        for name, ns in benches.items():
+            base = baseline.get(lab, {}).get(name)
+            if base and ns > base * (1 + threshold):
+                regressions.append((lab, name, base, ns))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--labs", nargs="+", default=["lab2", "lab3"])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown, 0.15 = 15%%")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        sys.path.insert(0, os.path.join(ROOT, args.worker))
+        json.dump(run_lab(args.repeat), sys.stdout)
+        return 0
+
+    results = {}
+    for lab in args.labs:
+        out = subprocess.run(
+            [sys.executable, __file__, "--worker", lab, "--repeat", str(args.repeat)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results[lab] = json.loads(out)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    for lab, benches in results.items():
+        print(f"[{lab}]")
+        for name, ns in benches.items():
+            base = baseline.get(lab, {}).get(name)
+            delta = f"{(ns / base - 1) * 100:+6.1f}%" if base else "    new"
+            print(f"  {name:<32} {ns:12.0f} ns/op  {delta}")
+
+    regressions = compare(results, baseline, args.threshold)
+    for lab, name, base, ns in regressions:
+        print(f"REGRESSION {lab}/{name}: {base:.0f} -> {ns:.0f} ns/op (> {args.threshold:.0%})")
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
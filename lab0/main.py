@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 class Item:
@@ -9,21 +11,74 @@ class Item:
         self.power: int = power
 
 
+class Inventory:
+    def __init__(self) -> None:
+        self._counts: Dict[Item, int] = {}
+        self.total_count: int = 0
+        self.total_power: int = 0
+
+    def add(self, item: Item, count: int = 1) -> None:
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        if count:
+            self._counts[item] = self._counts.get(item, 0) + count
+            self.total_count += count
+            self.total_power += item.power * count
+
+    def append(self, item: Item) -> None:
+        self.add(item)
+
+    def remove(self, item: Item, count: int = 1) -> int:
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        held = self._counts.get(item, 0)
+        removed = min(held, count)
+        if removed == held:
+            self._counts.pop(item, None)
+        else:
+            self._counts[item] = held - removed
+        self.total_count -= removed
+        self.total_power -= item.power * removed
+        return removed
+
+    def count(self, item: Item) -> int:
+        return self._counts.get(item, 0)
+
+    def items(self) -> List[Tuple[Item, int]]:
+        return list(self._counts.items())
+
+    def __iter__(self) -> Iterator[Item]:
+        # Same multiplicity as the old list of purchases, but grouped by item in
+        # first-acquired order: buying x, y, x iterates as x, x, y.
+        for item, count in self._counts.items():
+            for _ in range(count):
+                yield item
+
+    def __contains__(self, item: Item) -> bool:
+        return item in self._counts
+
+    def __len__(self) -> int:
+        return self.total_count
+
+
 class Player:
     def __init__(self, name: str, gold: int = 100) -> None:
         self.name: str = name
         self.gold: int = gold
-        self.inventory: List[Item] = []
+        self.inventory: Inventory = Inventory()
 
-    def buy(self, item: Item, cost: int) -> None:
-        if self.gold >= cost:
-            self.gold -= cost
+    def buy(self, item: Item, cost: int, payment: Optional["PaymentProcessor"] = None) -> bool:
+        if (payment or GoldPaymentProcessor()).pay(self, cost):
             self.inventory.append(item)
+            return True
+        return False
 
     def show_inventory(self) -> None:
         print(f"{self.name}'s Inventory:")
-        for i in self.inventory:
-            print(f" - {i.name} (+{i.power} power)")
+        for item, count in self.inventory.items():
+            suffix = f" x{count}" if count > 1 else ""
+            print(f" - {item.name}{suffix} (+{item.power * count} power)")
+        print(f"Total power: {self.inventory.total_power}")
         print(f"Gold left: {self.gold}\n")
 
 
@@ -32,24 +87,57 @@ class PriceModifier(ABC):
     def modify(self, price: int) -> int:
         pass
 
+    def modify_many(self, prices: List[int]) -> List[int]:
+        return [self.modify(price) for price in prices]
+
 
 class NoDiscount(PriceModifier):
     def modify(self, price: int) -> int:
         return price
 
+    def modify_many(self, prices: List[int]) -> List[int]:
+        return list(prices)
+
 
 class SeasonalDiscount(PriceModifier):
+    # Read-only so a cached price table can't go stale; use a new instance instead.
     def __init__(self, percent: float) -> None:
-        self.percent: float = percent
+        self._percent: float = percent
+
+    @property
+    def percent(self) -> float:
+        return self._percent
 
     def modify(self, price: int) -> int:
         return int(price * (1 - self.percent / 100))
 
+    def modify_many(self, prices: List[int]) -> List[int]:
+        factor = 1 - self.percent / 100
+        return [int(price * factor) for price in prices]
+
 
 class VIPDiscount(PriceModifier):
     def modify(self, price: int) -> int:
         return int(price * 0.8)
 
+    def modify_many(self, prices: List[int]) -> List[int]:
+        return [int(price * 0.8) for price in prices]
+
+
+class ChainedModifier(PriceModifier):
+    def __init__(self, *modifiers: PriceModifier) -> None:
+        self.modifiers: Tuple[PriceModifier, ...] = modifiers
+
+    def modify(self, price: int) -> int:
+        for modifier in self.modifiers:
+            price = modifier.modify(price)
+        return price
+
+    def modify_many(self, prices: List[int]) -> List[int]:
+        for modifier in self.modifiers:
+            prices = modifier.modify_many(prices)
+        return list(prices)
+
 
 class PaymentProcessor(ABC):
     @abstractmethod
@@ -65,21 +153,298 @@ class GoldPaymentProcessor(PaymentProcessor):
         return False
 
 
+class Purchase:
+    def __init__(self, player: Player, amount: int, txn_id: Optional[str] = None,
+                 item: Optional[Item] = None) -> None:
+        self.player: Player = player
+        self.amount: int = amount
+        self.txn_id: Optional[str] = txn_id
+        self.item: Optional[Item] = item
+
+
+class LedgerEntry:
+    def __init__(self, txn_id: Optional[str], player: Player, amount: int, balance: int, ok: bool) -> None:
+        self.txn_id: Optional[str] = txn_id
+        self.player: Player = player
+        self.amount: int = amount
+        self.balance: int = balance
+        self.ok: bool = ok
+
+
+class LedgerPaymentProcessor(PaymentProcessor):
+    def __init__(self, shards: int = 16) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shards)]
+        self._entries: List[List[LedgerEntry]] = [[] for _ in range(shards)]
+        # Keyed by (player, txn id): a reused id never hands one player's
+        # outcome to another, wherever the two players land.
+        self._seen: List[Dict[Tuple[Player, str], bool]] = [{} for _ in range(shards)]
+
+    def _shard(self, player: Player) -> int:
+        # Object addresses are aligned and allocated in strides, so their low bits
+        # barely vary; Fibonacci hashing mixes the address before taking the shard.
+        mixed = ((id(player) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32
+        return mixed % len(self._locks)
+
+    def _debit(self, shard: int, player: Player, amount: int, txn_id: Optional[str],
+               item: Optional[Item] = None) -> bool:
+        # Caller holds the shard lock; a replayed txn id returns its first outcome
+        # without charging or delivering the item again.
+        seen = self._seen[shard]
+        key = (player, txn_id)
+        if txn_id is not None and key in seen:
+            return seen[key]
+        ok = 0 <= amount <= player.gold
+        if ok:
+            player.gold -= amount
+            if item is not None:
+                player.inventory.add(item)
+        if txn_id is not None:
+            seen[key] = ok
+        self._entries[shard].append(LedgerEntry(txn_id, player, amount, player.gold, ok))
+        return ok
+
+    def pay(self, player: Player, amount: int, txn_id: Optional[str] = None) -> bool:
+        shard = self._shard(player)
+        with self._locks[shard]:
+            return self._debit(shard, player, amount, txn_id)
+
+    def settle(self, purchases: Iterable[Purchase]) -> List[bool]:
+        queued = list(purchases)
+        by_shard: Dict[int, List[int]] = {}
+        for i, purchase in enumerate(queued):
+            by_shard.setdefault(self._shard(purchase.player), []).append(i)
+
+        results: List[bool] = [False] * len(queued)
+        for shard, indexes in by_shard.items():
+            with self._locks[shard]:
+                for i in indexes:
+                    purchase = queued[i]
+                    results[i] = self._debit(shard, purchase.player, purchase.amount, purchase.txn_id,
+                                             purchase.item)
+        return results
+
+    def history(self, player: Player) -> List[LedgerEntry]:
+        shard = self._shard(player)
+        with self._locks[shard]:
+            return [entry for entry in self._entries[shard] if entry.player is player]
+
+
+class Loadout:
+    def __init__(self, items: List[Item], power: int, cost: int, exact: bool = True) -> None:
+        self.items: List[Item] = items
+        self.power: int = power
+        self.cost: int = cost
+        self.exact: bool = exact
+
+
+class Catalog:
+    # Changes go through add() and replace() so the indexes and any price table
+    # stay in sync; items is a read-only snapshot rebuilt after a change.
+    def __init__(self, items: List[Item]) -> None:
+        self._items: List[Item] = list(items)
+        self._snapshot: Optional[Tuple[Item, ...]] = None
+        self.version: int = 0
+        self.rewrites: int = 0
+        self._by_price: List[Tuple[int, int, Item]] = sorted(
+            ((item.price, i, item) for i, item in enumerate(self._items)), key=lambda e: e[:2]
+        )
+        self._by_power: List[Tuple[int, int, Item]] = sorted(
+            ((item.power, i, item) for i, item in enumerate(self._items)), key=lambda e: e[:2]
+        )
+
+    @property
+    def items(self) -> Tuple[Item, ...]:
+        if self._snapshot is None:
+            self._snapshot = tuple(self._items)
+        return self._snapshot
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: Item) -> None:
+        i = len(self._items)
+        self._items.append(item)
+        insort(self._by_price, (item.price, i, item), key=lambda e: e[:2])
+        insort(self._by_power, (item.power, i, item), key=lambda e: e[:2])
+        self._snapshot = None
+        self.version += 1
+
+    def replace(self, index: int, item: Item) -> None:
+        old = self._items[index]
+        for entries, key in ((self._by_price, "price"), (self._by_power, "power")):
+            del entries[bisect_left(entries, (getattr(old, key), index), key=lambda e: e[:2])]
+            insort(entries, (getattr(item, key), index, item), key=lambda e: e[:2])
+        self._items[index] = item
+        self._snapshot = None
+        self.version += 1
+        self.rewrites += 1
+
+    @staticmethod
+    def _range(index: List[Tuple[int, int, Item]], low: int, high: int) -> List[Item]:
+        start = bisect_left(index, low, key=lambda e: e[0])
+        stop = bisect_right(index, high, key=lambda e: e[0])
+        return [entry[2] for entry in index[start:stop]]
+
+    def in_price_range(self, low: int, high: int) -> List[Item]:
+        return self._range(self._by_price, low, high)
+
+    def in_power_range(self, low: int, high: int) -> List[Item]:
+        return self._range(self._by_power, low, high)
+
+    def cheapest(self, n: int) -> List[Item]:
+        return [entry[2] for entry in self._by_price[:n]]
+
+    def strongest(self, n: int) -> List[Item]:
+        return [entry[2] for entry in reversed(self._by_power[-n:])] if n > 0 else []
+
+    def _candidates(self, gold: int, prices: List[int]) -> Tuple[List[Item], List[Tuple[int, int, Item]]]:
+        # Items arrive strongest first, so every kept item at or below an item's
+        # price is at least as strong. Once those cost more than gold - price
+        # together, no loadout holds the item and all of them, and swapping in the
+        # one left out never loses power, so the item can be dropped. spent is a
+        # Fenwick tree of kept cost by price. At most gold // price items of one
+        # price survive, and usually far fewer.
+        free: List[Item] = []
+        spent: List[int] = [0] * (gold + 1)
+        candidates: List[Tuple[int, int, Item]] = []
+        for power, i, item in reversed(self._by_power):
+            if power <= 0:
+                break
+            price = prices[i]
+            if price <= 0:
+                free.append(item)
+                continue
+            if price > gold:
+                continue
+            cheaper, j = 0, price
+            while j > 0:
+                cheaper += spent[j]
+                j &= j - 1
+            if cheaper > gold - price:
+                continue
+            j = price
+            while j <= gold:
+                spent[j] += price
+                j += j & -j
+            candidates.append((price, power, item))
+        return free, candidates
+
+    def best_loadout(self, gold: int, modifier: PriceModifier, prices: Optional[List[int]] = None,
+                     max_cells: Optional[int] = None) -> Loadout:
+        if prices is None:
+            prices = modifier.modify_many([item.price for item in self.items])
+        gold = max(0, gold)
+        free, candidates = self._candidates(gold, prices)
+        # A budget beyond the cost of every candidate buys nothing more.
+        gold = min(gold, sum(price for price, _, _ in candidates))
+
+        # The knapsack costs len(candidates) * gold cells. Callers that set
+        # max_cells accept a greedy fill by power per gold past that size; it
+        # stays within one item's power of the optimum and is marked inexact.
+        if max_cells is not None and max_cells < len(candidates) * (gold + 1):
+            chosen: List[Item] = list(free)
+            cost = 0
+            for price, _, item in sorted(candidates, key=lambda c: c[1] / c[0], reverse=True):
+                if cost + price <= gold:
+                    chosen.append(item)
+                    cost += price
+            return Loadout(chosen, sum(item.power for item in chosen), cost, exact=False)
+
+        # 0/1 knapsack over budget: best[c] is the most power for cost <= c.
+        best: List[int] = [0] * (gold + 1)
+        taken: List[bytes] = []
+        for price, power, _ in candidates:
+            keep = best[price:]
+            add = best[:gold + 1 - price]
+            take = [b + power > k for k, b in zip(keep, add)]
+            best[price:] = [b + power if t else k for k, b, t in zip(keep, add, take)]
+            taken.append(bytes(take))
+
+        chosen = list(free)
+        cost = 0
+        budget = gold
+        for (price, _, item), take in zip(reversed(candidates), reversed(taken)):
+            if budget >= price and take[budget - price]:
+                chosen.append(item)
+                budget -= price
+                cost += price
+
+        return Loadout(chosen, sum(item.power for item in chosen), cost)
+
+
+class PricingEngine:
+    def __init__(self, catalog: Catalog, modifier: PriceModifier) -> None:
+        self.catalog: Catalog = catalog
+        self._modifier: PriceModifier = modifier
+        self._prices: List[int] = []
+        self._rewrites: int = catalog.rewrites
+
+    @property
+    def modifier(self) -> PriceModifier:
+        return self._modifier
+
+    @modifier.setter
+    def modifier(self, modifier: PriceModifier) -> None:
+        self._modifier = modifier
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._prices = []
+
+    @property
+    def prices(self) -> List[int]:
+        # Appends are priced on their own; a replaced item reprices everything.
+        catalog = self.catalog
+        if self._rewrites != catalog.rewrites:
+            self._prices = []
+            self._rewrites = catalog.rewrites
+        items = catalog.items
+        if len(self._prices) < len(items):
+            tail = items[len(self._prices):]
+            self._prices.extend(self._modifier.modify_many([item.price for item in tail]))
+        return self._prices
+
+    def price_of(self, index: int) -> int:
+        return self.prices[index]
+
+
 class Shop:
     def __init__(self, items: List[Item], payment_processor: PaymentProcessor, modifier: PriceModifier) -> None:
-        self.items: List[Item] = items
         self.payment: PaymentProcessor = payment_processor
-        self.modifier: PriceModifier = modifier
+        self.catalog: Catalog = Catalog(items)
+        self.pricing: PricingEngine = PricingEngine(self.catalog, modifier)
+
+    @property
+    def items(self) -> Tuple[Item, ...]:
+        return self.catalog.items
+
+    @property
+    def modifier(self) -> PriceModifier:
+        return self.pricing.modifier
+
+    @modifier.setter
+    def modifier(self, modifier: PriceModifier) -> None:
+        self.pricing.modifier = modifier
+
+    def add_item(self, item: Item) -> None:
+        self.catalog.add(item)
+
+    def replace_item(self, item_index: int, item: Item) -> None:
+        self.catalog.replace(item_index - 1, item)
 
     def display_items(self) -> None:
-        for i, item in enumerate(self.items, 1):
-            print(f"{i}. {item.name} - {item.price} gold (+{item.power} power)")
+        for i, (item, price) in enumerate(zip(self.items, self.pricing.prices), 1):
+            print(f"{i}. {item.name} - {price} gold (+{item.power} power)")
+
+    def best_loadout(self, player: Player) -> Loadout:
+        return self.catalog.best_loadout(player.gold, self.modifier, self.pricing.prices)
 
     def sell(self, player: Player, item_index: int) -> None:
         item: Item = self.items[item_index - 1]
-        final_price: int = self.modifier.modify(item.price)
-        if self.payment.pay(player, final_price):
-            player.inventory.append(item)
+        final_price: int = self.pricing.price_of(item_index - 1)
+        player.buy(item, final_price, self.payment)
 
 
 if __name__ == "__main__":
@@ -96,3 +461,7 @@ if __name__ == "__main__":
     shop.sell(player, 1)
     shop.sell(player, 3)
     player.show_inventory()
+
+    best = shop.best_loadout(player)
+    print(f"Best loadout for {player.gold} gold: "
+          f"{', '.join(i.name for i in best.items)} (+{best.power} power, {best.cost} gold)")
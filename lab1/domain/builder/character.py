@@ -1,8 +1,11 @@
-class Character:
+from domain.flyweight.archetype import ArchetypeMixin, archetypes
+
+class Character(ArchetypeMixin):
+    __slots__ = ("name", "archetype", "health", "strength")
+
     def __init__(self, name, char_class, weapon, health, strength):
         self.name = name
-        self.char_class = char_class
-        self.weapon = weapon
+        self.archetype = archetypes.get(char_class, weapon)
         self.health = health
         self.strength = strength
 
@@ -0,0 +1,69 @@
+import threading
+
+
+class Archetype:
+    __slots__ = ("char_class", "weapon")
+
+    def __init__(self, char_class, weapon):
+        object.__setattr__(self, "char_class", char_class)
+        object.__setattr__(self, "weapon", weapon)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Archetype is immutable")
+
+    # Shared by every character that uses it, so copies must not duplicate it.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (get_archetype, (self.char_class, self.weapon))
+
+    def __repr__(self):
+        return f"Archetype({self.char_class!r}, {self.weapon!r})"
+
+
+class ArchetypeRegistry:
+    def __init__(self):
+        self._archetypes = {}
+        self._lock = threading.Lock()
+
+    def get(self, char_class, weapon):
+        key = (char_class, weapon)
+        archetype = self._archetypes.get(key)
+        if archetype is None:
+            with self._lock:
+                archetype = self._archetypes.setdefault(key, Archetype(char_class, weapon))
+        return archetype
+
+    def __len__(self):
+        return len(self._archetypes)
+
+
+archetypes = ArchetypeRegistry()
+
+
+def get_archetype(char_class, weapon):
+    return archetypes.get(char_class, weapon)
+
+
+class ArchetypeMixin:
+    __slots__ = ()
+
+    @property
+    def char_class(self):
+        return self.archetype.char_class
+
+    @char_class.setter
+    def char_class(self, value):
+        self.archetype = archetypes.get(value, self.archetype.weapon)
+
+    @property
+    def weapon(self):
+        return self.archetype.weapon
+
+    @weapon.setter
+    def weapon(self, value):
+        self.archetype = archetypes.get(self.archetype.char_class, value)
@@ -1,17 +1,36 @@
 import copy
 
+from domain.flyweight.archetype import ArchetypeMixin, archetypes
+
 class Prototype:
+    __slots__ = ()
+
     def clone(self):
         return copy.deepcopy(self)
 
-class BaseCharacter(Prototype):
+class BaseCharacter(ArchetypeMixin, Prototype):
+    # char_class and weapon live in a shared Archetype flyweight, so a clone
+    # only holds its own name and stats.
+    __slots__ = ("name", "archetype", "health", "strength")
+
     def __init__(self, name, char_class, weapon, health, strength):
         self.name = name
-        self.char_class = char_class
-        self.weapon = weapon
+        self.archetype = archetypes.get(char_class, weapon)
         self.health = health
         self.strength = strength
 
+    def clone(self):
+        # The fast path only knows BaseCharacter's own slots; subclasses may
+        # carry more state, so they keep the deepcopy contract.
+        if type(self) is not BaseCharacter:
+            return super().clone()
+        clone = object.__new__(BaseCharacter)
+        clone.name = self.name
+        clone.archetype = self.archetype
+        clone.health = self.health
+        clone.strength = self.strength
+        return clone
+
     def show_info(self):
         print(f"{self.name} ({self.char_class}) with {self.weapon} | "
               f"HP: {self.health} | STR: {self.strength}")
@@ -0,0 +1,48 @@
+import threading
+
+from .character_prototype import BaseCharacter
+
+
+class CloneSpawner:
+    def __init__(self, prototype, size=1024):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.prototype = prototype
+        self.size = size
+        self._lock = threading.Lock()
+        self._pool = [prototype.clone() for _ in range(size)]
+
+    def _reset(self, clone):
+        if type(clone) is not BaseCharacter:
+            return self.prototype.clone()
+        clone.name = self.prototype.name
+        clone.archetype = self.prototype.archetype
+        clone.health = self.prototype.health
+        clone.strength = self.prototype.strength
+        return clone
+
+    def spawn(self, name=None):
+        with self._lock:
+            clone = self._pool.pop() if self._pool else self.prototype.clone()
+        if name is not None:
+            clone.name = name
+        return clone
+
+    def spawn_many(self, count, name_format=None):
+        with self._lock:
+            taken = min(count, len(self._pool))
+            clones = self._pool[len(self._pool) - taken:]
+            del self._pool[len(self._pool) - taken:]
+        clones.extend(self.prototype.clone() for _ in range(count - taken))
+        if name_format is not None:
+            for i, clone in enumerate(clones):
+                clone.name = name_format.format(i)
+        return clones
+
+    def release(self, *clones):
+        with self._lock:
+            room = self.size - len(self._pool)
+            self._pool.extend(self._reset(clone) for clone in clones[:room])
+
+    def available(self):
+        return len(self._pool)
@@ -1,5 +1,7 @@
 import sys
 import os
+import time
+import uuid
 import streamlit as st
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,11 +16,31 @@ st.write("Using Builder, Prototype, Singleton, Adapter, Decorator, Facade + Real
 
 
 if "game" not in st.session_state:
-    st.session_state["game"] = GameFacade()
+    # Each browser session gets its own game state instead of sharing the
+    # process-wide GameManager slots with every other user.
+    st.session_state["game"] = GameFacade(session_id=str(uuid.uuid4()))
 
 game: GameFacade = st.session_state["game"]
 
 
+with st.sidebar:
+    st.markdown("### ⏱️ Metrics")
+    if st.checkbox("Collect timing metrics"):
+        game.enable_metrics()
+    else:
+        game.disable_metrics()
+
+    metrics_panel = st.empty()
+
+
+def render_metrics():
+    snapshot = game.metrics_snapshot()
+    if snapshot:
+        metrics_panel.table([{"metric": name, **values} for name, values in snapshot.items()])
+    else:
+        metrics_panel.caption("Metrics are off or nothing has been measured yet.")
+
+
 st.subheader("1. Define Characters (Adapter + Builder + Prototype)")
 
 col1, col2 = st.columns(2)
@@ -105,15 +127,19 @@ with b2:
 
 st.subheader("4. Real-Time Battle Simulation (Singleton + Facade)")
 
+turn_delay = st.slider("Turn delay (seconds)", 0.0, 1.0, 0.7, 0.05)
+target_fps = st.slider("Max UI refreshes per second", 1, 30, 10)
+fast_forward = st.checkbox("Fast-forward (skip animation, show final state)")
+
 battle_text = st.empty()
 hp_display = st.empty()
-log_display = st.empty()
+log_display = st.container()
 
 if "battle_log" not in st.session_state:
     st.session_state["battle_log"] = []
 
 
-def update_battle_ui(text, hp1, hp2):
+def render_health(name1, name2, hp1, hp2):
     max_bar = 20
     bar1 = "█" * max(0, int(hp1 / 200 * max_bar))
     bar2 = "█" * max(0, int(hp2 / 200 * max_bar))
@@ -121,27 +147,66 @@ def update_battle_ui(text, hp1, hp2):
     hp_display.markdown(
         f"""
         ### ❤️ Health Bars  
-        **{game.get_character(1).get_name()}**: {hp1}  
+        **{name1}**: {hp1}  
         `{bar1}`  
 
-        **{game.get_character(2).get_name()}**: {hp2}  
+        **{name2}**: {hp2}  
         `{bar2}`
         """
     )
 
-    battle_text.markdown(f"### {text}")
-
-    st.session_state["battle_log"].append(text)
 
-    log_display.markdown(
-        "#### Battle Log\n" + "\n".join([f"- {line}" for line in st.session_state["battle_log"]])
-    )
+class BattleRenderer:
+    # Appends only new log lines and redraws at most `fps` times per second;
+    # when turns arrive faster than that, intermediate HP/text frames are
+    # dropped and their log lines are written together on the next flush.
+
+    def __init__(self, name1, name2, fps):
+        self._names = (name1, name2)
+        self._interval = 1.0 / fps
+        self._last_flush = float("-inf")
+        self._pending = []
+        self._latest = None
+
+    def __call__(self, text, hp1, hp2):
+        st.session_state["battle_log"].append(text)
+        self._pending.append(text)
+        self._latest = (text, hp1, hp2)
+        if time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+
+    def flush(self):
+        if self._latest is None:
+            return
+        text, hp1, hp2 = self._latest
+        render_health(*self._names, hp1, hp2)
+        battle_text.markdown(f"### {text}")
+        if self._pending:
+            log_display.markdown("\n".join(f"- {line}" for line in self._pending))
+            self._pending = []
+        self._last_flush = time.monotonic()
 
 
 if st.button("Start Real-Time Battle"):
     if not ch1 or not ch2:
         st.error("Load both characters first!")
     else:
-        st.session_state["battle_log"] = [] 
-        winner, _ = game.run_battle_realtime(update_battle_ui)
+        st.session_state["battle_log"] = []
+        log_display.markdown("#### Battle Log")
+
+        if fast_forward:
+            result = game.run_battle_headless(collect_logs=True)
+            st.session_state["battle_log"] = result.logs
+            render_health(ch1.get_name(), ch2.get_name(), result.hp1, result.hp2)
+            battle_text.markdown(f"### {result.logs[-1]}")
+            log_display.markdown("\n".join(f"- {line}" for line in result.logs))
+            winner = game.get_character(result.winner_slot)
+        else:
+            renderer = BattleRenderer(ch1.get_name(), ch2.get_name(), target_fps)
+            winner, _ = game.run_battle_realtime(renderer, turn_delay)
+            renderer.flush()
+
         st.success(f"Winner: {winner.get_name()}")
+
+
+render_metrics()
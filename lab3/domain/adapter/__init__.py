@@ -1 +1,2 @@
 from .json_character_adapter import JSONCharacterAdapter
+from .ndjson_character_loader import CharacterRecordError, NDJSONCharacterLoader, iter_lines, validate_record
@@ -0,0 +1,115 @@
+import json
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from domain.builder.character_builder import CharacterBuilder
+from domain.models.character import Character
+from domain.models.character_table import CharacterTable
+from .json_character_adapter import JSONCharacterAdapter
+
+STAT_KEYS = ("health", "attack", "speed")
+
+
+class CharacterRecordError(ValueError):
+    def __init__(self, line_no: int, message: str):
+        super().__init__(f"line {line_no}: {message}")
+        self.line_no = line_no
+
+
+def validate_record(data, line_no: int = 0) -> None:
+    if not isinstance(data, dict):
+        raise CharacterRecordError(line_no, "record must be a JSON object")
+    if not isinstance(data.get("name"), str):
+        raise CharacterRecordError(line_no, "'name' must be a string")
+    stats = data.get("stats")
+    if not isinstance(stats, dict):
+        raise CharacterRecordError(line_no, "'stats' must be an object")
+    for key in STAT_KEYS:
+        value = stats.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise CharacterRecordError(line_no, f"'stats.{key}' must be a number")
+        try:
+            int(value)
+        except (ValueError, OverflowError):
+            raise CharacterRecordError(line_no, f"'stats.{key}' must be a number") from None
+
+
+def iter_lines(stream: BinaryIO, chunk_size: int = 1 << 16, max_line: int = 1 << 20) -> Iterator[Tuple[int, bytes]]:
+    # Reads fixed-size chunks and carries only the unfinished tail between them,
+    # so memory is bounded by chunk_size + max_line regardless of file size.
+    tail = b""
+    line_no = 0
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        if len(tail) > max_line:
+            raise CharacterRecordError(line_no + len(lines) + 1, f"line longer than {max_line} bytes")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+    if tail.strip():
+        yield line_no + 1, tail
+
+
+class NDJSONCharacterLoader:
+    def __init__(self, prototype: Optional[Character] = None, batch_size: int = 1000,
+                 skip_invalid: bool = False, chunk_size: int = 1 << 16):
+        self._builder = CharacterBuilder()
+        self._prototype = prototype
+        self._batch_size = batch_size
+        self._skip_invalid = skip_invalid
+        self._chunk_size = chunk_size
+        self.loaded = 0
+        self.skipped = 0
+
+    def _records(self, source: Union[str, BinaryIO]) -> Iterator[dict]:
+        if isinstance(source, str):
+            with open(source, "rb") as stream:
+                yield from self._records(stream)
+            return
+
+        for line_no, line in iter_lines(source, self._chunk_size):
+            try:
+                try:
+                    data = json.loads(line)
+                except ValueError as exc:
+                    raise CharacterRecordError(line_no, f"invalid JSON ({exc})") from None
+                validate_record(data, line_no)
+            except CharacterRecordError:
+                if not self._skip_invalid:
+                    raise
+                self.skipped += 1
+                continue
+            yield data
+
+    def _prepare(self, data: dict) -> CharacterBuilder:
+        builder = self._builder.from_adapter(JSONCharacterAdapter(data))
+        if self._prototype is not None:
+            builder.apply_prototype(self._prototype)
+        return builder
+
+    def iter_batches(self, source: Union[str, BinaryIO]) -> Iterator[List[Character]]:
+        batch: List[Character] = []
+        for data in self._records(source):
+            batch.append(self._prepare(data).build())
+            if len(batch) >= self._batch_size:
+                self.loaded += len(batch)
+                yield batch
+                batch = []
+        if batch:
+            self.loaded += len(batch)
+            yield batch
+
+    def iter_characters(self, source: Union[str, BinaryIO]) -> Iterator[Character]:
+        for batch in self.iter_batches(source):
+            yield from batch
+
+    def load_into(self, source: Union[str, BinaryIO], table: Optional[CharacterTable] = None) -> CharacterTable:
+        table = table if table is not None else CharacterTable()
+        for data in self._records(source):
+            self._prepare(data).build_into(table)
+            self.loaded += 1
+        return table
@@ -1,3 +1,4 @@
 from .observer import Observer
 from .subject import Subject
 from .battle_logger import BattleLogger
+from .event_bus import ALL_EVENTS, EventBus
@@ -1,27 +1,88 @@
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 from .observer import Observer
 
+Record = Tuple[Any, ...]
+
 
 class BattleLogger(Observer):
+    """Keeps compact tuple records in a bounded ring buffer and formats text only when read.
+
+    When ``spill_path`` is set, records pushed out of the ring are appended to
+    that file as text instead of being dropped.
+    """
 
-    def __init__(self):
-        self.logs: List[str] = []
+    def __init__(self, capacity: int = 10_000, spill_path: Optional[str] = None):
+        self._records: deque = deque(maxlen=capacity)
+        self._spill_path = spill_path
+        self._spill_file: Optional[TextIO] = None
+        self.spilled = 0
+        self._handlers = {
+            "battle_started": self._on_battle_started,
+            "attack": self._on_attack,
+            "battle_finished": self._on_battle_finished,
+        }
 
     def update(self, event_type: str, data: Dict[str, Any]) -> None:
-        if event_type == "battle_started":
-            c1 = data["char1"].get_name()
-            c2 = data["char2"].get_name()
-            self.logs.append(f"Battle begins between {c1} and {c2}")
-
-        elif event_type == "attack":
-            atk = data["attacker"].get_name()
-            df = data["defender"].get_name()
-            dmg = data["damage"]
-            hp_after = data["defender_hp"]
-            self.logs.append(
-                f"{atk} hits {df} for {dmg} damage (HP now {hp_after})"
-            )
-
-        elif event_type == "battle_finished":
-            winner = data["winner"].get_name()
-            self.logs.append(f"Winner: {winner}")
+        handler = self._handlers.get(event_type)
+        if handler is not None:
+            self._append(handler(data))
+
+    def update_batch(self, event_type: str, events: List[Dict[str, Any]]) -> None:
+        handler = self._handlers.get(event_type)
+        if handler is not None:
+            for data in events:
+                self._append(handler(data))
+
+    def _on_battle_started(self, data: Dict[str, Any]) -> Record:
+        return ("battle_started", data["char1"].get_name(), data["char2"].get_name())
+
+    def _on_attack(self, data: Dict[str, Any]) -> Record:
+        return ("attack", data["attacker"].get_name(), data["defender"].get_name(),
+                data["damage"], data["defender_hp"])
+
+    def _on_battle_finished(self, data: Dict[str, Any]) -> Record:
+        return ("battle_finished", data["winner"].get_name())
+
+    def _append(self, record: Record) -> None:
+        records = self._records
+        if self._spill_path is not None and len(records) == records.maxlen:
+            if self._spill_file is None:
+                self._spill_file = open(self._spill_path, "a", encoding="utf-8")
+            self._spill_file.write(self.format(records[0]) + "\n")
+            self.spilled += 1
+        records.append(record)
+
+    @staticmethod
+    def format(record: Record) -> str:
+        kind = record[0]
+        if kind == "attack":
+            _, atk, df, dmg, hp_after = record
+            return f"{atk} hits {df} for {dmg} damage (HP now {hp_after})"
+        if kind == "battle_started":
+            return f"Battle begins between {record[1]} and {record[2]}"
+        return f"Winner: {record[1]}"
+
+    @property
+    def records(self) -> List[Record]:
+        return list(self._records)
+
+    @property
+    def logs(self) -> List[str]:
+        return list(self.iter_logs())
+
+    def iter_logs(self) -> Iterator[str]:
+        fmt = self.format
+        for record in list(self._records):
+            yield fmt(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
@@ -0,0 +1,166 @@
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from .observer import Observer
+from .subject import Subject
+
+ALL_EVENTS = "*"
+
+logger = logging.getLogger(__name__)
+
+
+class EventBus(Subject):
+    """Subject with per-event-type subscriptions, batched delivery and optional background dispatch.
+
+    Events listed in ``batched_events`` are buffered and handed to observers
+    through ``update_batch`` once ``batch_size`` accumulate or when any other
+    event is published. Everything is delivered in publish order, also across
+    threads. With ``background=True`` delivery happens on a worker thread and
+    publishing never waits on a slow observer, unless the bounded queue is full.
+    """
+
+    def __init__(self, batched_events: Iterable[str] = ("attack",), batch_size: int = 64,
+                 background: bool = False, max_queue: int = 10_000):
+        super().__init__()
+        self._lock = threading.Lock()
+        # Tuples are replaced, never mutated, so publishing reads them without locking.
+        self._subscribers: Dict[str, Tuple[Observer, ...]] = {}
+        self._batched = frozenset(batched_events)
+        self._batch_size = batch_size
+        self._pending_type: Optional[str] = None
+        self._pending: List[dict] = []
+        self._ready: Deque[Tuple[str, List[dict]]] = deque()
+        self._dispatching = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(max_queue)
+            self._worker = threading.Thread(target=self._run, name="event-bus", daemon=True)
+            self._worker.start()
+
+    # -------- Subscriptions --------
+
+    def subscribe(self, observer: Observer, *event_types: str) -> None:
+        with self._lock:
+            for event_type in event_types or (ALL_EVENTS,):
+                current = self._subscribers.get(event_type, ())
+                if observer not in current:
+                    self._subscribers[event_type] = current + (observer,)
+            if not event_types and observer not in self._observers:
+                self._observers.append(observer)
+
+    def unsubscribe(self, observer: Observer, *event_types: str) -> None:
+        with self._lock:
+            for event_type in event_types or tuple(self._subscribers):
+                remaining = tuple(o for o in self._subscribers.get(event_type, ()) if o is not observer)
+                if remaining:
+                    self._subscribers[event_type] = remaining
+                else:
+                    self._subscribers.pop(event_type, None)
+            if not event_types and observer in self._observers:
+                self._observers.remove(observer)
+
+    def attach(self, observer: Observer) -> None:
+        self.subscribe(observer)
+
+    def detach(self, observer: Observer) -> None:
+        self.unsubscribe(observer)
+
+    def has_subscribers(self, event_type: str) -> bool:
+        subscribers = self._subscribers
+        return event_type in subscribers or ALL_EVENTS in subscribers
+
+    # -------- Publishing --------
+
+    def publish(self, event_type: str, data: dict) -> None:
+        subscribers = self._subscribers
+        if event_type not in subscribers and ALL_EVENTS not in subscribers:
+            return
+
+        with self._lock:
+            if event_type in self._batched:
+                if self._pending_type != event_type:
+                    self._take_pending_locked()
+                    self._pending_type = event_type
+                self._pending.append(data)
+                if len(self._pending) >= self._batch_size:
+                    self._take_pending_locked()
+            else:
+                self._take_pending_locked()
+                self._ready.append((event_type, [data]))
+        self._drain()
+
+    def notify(self, event_type: str, data: dict) -> None:
+        self.publish(event_type, data)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._take_pending_locked()
+        self._drain()
+
+    def _take_pending_locked(self) -> None:
+        if self._pending:
+            self._ready.append((self._pending_type, self._pending))
+            self._pending = []
+
+    def _drain(self) -> None:
+        # Batches queue up in the order they were taken and one thread at a time
+        # delivers them, outside the lock. Observers may call back into the bus,
+        # and anyone who finds a delivery in progress leaves their events to it.
+        while self._ready:
+            if not self._dispatching.acquire(blocking=False):
+                return
+            try:
+                while True:
+                    with self._lock:
+                        if not self._ready:
+                            break
+                        event_type, events = self._ready.popleft()
+                    self._deliver(event_type, events)
+            finally:
+                self._dispatching.release()
+
+    def _deliver(self, event_type: str, events: List[dict]) -> None:
+        if self._queue is not None:
+            self._queue.put((event_type, events))
+        else:
+            self._dispatch(event_type, events)
+
+    def _dispatch(self, event_type: str, events: List[dict]) -> None:
+        observers = self._subscribers.get(event_type, ()) + self._subscribers.get(ALL_EVENTS, ())
+        for observer in observers:
+            if len(events) == 1:
+                observer.update(event_type, events[0])
+            else:
+                observer.update_batch(event_type, events)
+
+    # -------- Background dispatch --------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                try:
+                    self._dispatch(*item)
+                except Exception:
+                    logger.exception("Observer failed while handling %r", item[0])
+            finally:
+                self._queue.task_done()
+
+    def join(self) -> None:
+        # Blocks until every published event has been delivered.
+        self.flush()
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        self.join()
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 class Observer(ABC):
@@ -7,3 +7,7 @@ class Observer(ABC):
     @abstractmethod
     def update(self, event_type: str, data: Dict[str, Any]) -> None:
         ...
+
+    def update_batch(self, event_type: str, events: List[Dict[str, Any]]) -> None:
+        for data in events:
+            self.update(event_type, data)
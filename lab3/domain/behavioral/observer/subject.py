@@ -14,6 +14,9 @@ class Subject:
         if observer in self._observers:
             self._observers.remove(observer)
 
+    def has_subscribers(self, event_type: str) -> bool:
+        return bool(self._observers)
+
     def notify(self, event_type: str, data: dict) -> None:
         for obs in self._observers:
             obs.update(event_type, data)
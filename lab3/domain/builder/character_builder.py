@@ -1,4 +1,6 @@
 from domain.models.character import Character
+from domain.models.character_table import CharacterRow, CharacterTable
+from domain.models.slotted_character import SlottedCharacter
 
 
 class CharacterBuilder:
@@ -35,3 +37,13 @@ class CharacterBuilder:
         ch = Character(self._name, self._health, self._attack, self._speed)
         self.reset()
         return ch
+
+    def build_slotted(self) -> SlottedCharacter:
+        ch = SlottedCharacter(self._name, self._health, self._attack, self._speed)
+        self.reset()
+        return ch
+
+    def build_into(self, table: CharacterTable) -> CharacterRow:
+        row = table.append(self._name, self._health, self._attack, self._speed)
+        self.reset()
+        return row
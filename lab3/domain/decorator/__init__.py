@@ -1,3 +1,4 @@
 from .character_decorator import CharacterDecorator
 from .attack_boost import AttackBoost
 from .shield_boost import ShieldBoost
+from .compiled_character import CompiledCharacter, compile_chain
@@ -0,0 +1,88 @@
+from .character_decorator import CharacterDecorator
+from .attack_boost import AttackBoost
+from .shield_boost import ShieldBoost
+
+
+class CompiledCharacter(CharacterDecorator):
+    """Flat snapshot of a decorator chain: every getter is O(1) regardless of stack depth.
+
+    Health follows the same rule as stacked ShieldBoosts, which compose to
+    max(floor, base_health + offset).
+    """
+
+    def __init__(self, wrapped, base, attack: int, health_offset: int, health_floor: int):
+        super().__init__(wrapped)
+        self._base = base
+        self._attack = attack
+        self._health_offset = health_offset
+        self._health_floor = health_floor
+
+    @property
+    def chain(self):
+        return self._wrapped
+
+    def get_name(self) -> str:
+        return self._base.get_name()
+
+    def get_health(self) -> int:
+        return max(self._health_floor, self._base.get_health() + self._health_offset)
+
+    def get_attack(self) -> int:
+        return self._attack
+
+    def get_speed(self) -> int:
+        return self._base.get_speed()
+
+    def take_damage(self, amount: int) -> None:
+        self._base.take_damage(amount)
+
+    def to_dict(self) -> dict:
+        return self._base.to_dict()
+
+    def extend(self, decorator: CharacterDecorator):
+        # Folds one new outermost buff into the snapshot without re-walking the chain.
+        if decorator._wrapped is not self._wrapped:
+            raise ValueError("Decorator must wrap this snapshot's chain")
+        if type(decorator) is AttackBoost:
+            return CompiledCharacter(decorator, self._base, self._attack + decorator._bonus,
+                                     self._health_offset, self._health_floor)
+        if type(decorator) is ShieldBoost:
+            return CompiledCharacter(decorator, self._base, self._attack,
+                                     self._health_offset + decorator._shield,
+                                     max(0, self._health_floor + decorator._shield))
+        return compile_chain(decorator)
+
+
+def compile_chain(ch):
+    """Collapse a chain of AttackBoost/ShieldBoost wrappers into a CompiledCharacter.
+
+    Plain characters and chains containing other decorator types are returned unchanged.
+    """
+    if isinstance(ch, CompiledCharacter):
+        return ch
+
+    layers = []
+    node = ch
+    while isinstance(node, CharacterDecorator):
+        if isinstance(node, CompiledCharacter):
+            node = node.chain
+            continue
+        if type(node) not in (AttackBoost, ShieldBoost):
+            return ch
+        layers.append(node)
+        node = node._wrapped
+
+    if not layers:
+        return ch
+
+    attack = node.get_attack()
+    offset = 0
+    floor = 0
+    for layer in reversed(layers):
+        if type(layer) is AttackBoost:
+            attack += layer._bonus
+        else:
+            offset += layer._shield
+            floor = max(0, floor + layer._shield)
+
+    return CompiledCharacter(ch, node, attack, offset, floor)
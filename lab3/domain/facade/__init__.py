@@ -1 +1,3 @@
 from .game_facade import GameFacade
+from .metrics import Metrics
+from .outcome_cache import BattleOutcomeCache
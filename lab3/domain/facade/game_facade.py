@@ -1,24 +1,95 @@
-from typing import Tuple, List, Optional
+import inspect
+from time import perf_counter
+from typing import Dict, Tuple, List, Optional
 
 from domain.singleton import GameManager
 from domain.builder import CharacterBuilder
 from domain.prototype import CharacterPrototypeManager
-from domain.adapter import JSONCharacterAdapter
-from domain.decorator import AttackBoost, ShieldBoost
-from domain.models import Character
+from domain.adapter import JSONCharacterAdapter, NDJSONCharacterLoader
+from domain.decorator import AttackBoost, ShieldBoost, CharacterDecorator, CompiledCharacter, compile_chain
+from domain.models import Character, CharacterTable, BattleResult
+from domain.behavioral.observer import Observer
+from domain.facade.metrics import Metrics
+from domain.facade.outcome_cache import BattleOutcomeCache
+from domain.simulation import (
+    VarianceModel, WinEstimate, estimate_win_probability, BattleReplay, record_battle,
+    InitiativeResult, RaidResult, run_raid,
+)
 
 
 class GameFacade:
-    def __init__(self):
-        self._manager = GameManager()
+    # Outcomes depend only on resolved stats, so every facade shares one cache by default.
+    _shared_outcome_cache = BattleOutcomeCache()
+
+    def __init__(self, session_id=None, outcome_cache: Optional[BattleOutcomeCache] = None):
+        # With a session id, state lives in GameManager's session store and is
+        # looked up on every call, so an evicted session simply starts fresh.
+        self._session_id = session_id
+        self._default_manager = GameManager() if session_id is None else None
         self._builder = CharacterBuilder()
         self._prototypes = CharacterPrototypeManager()
+        # None while metrics are off, so the hot paths only pay an `is None` check.
+        self._metrics: Optional[Metrics] = None
+        self._outcome_cache = outcome_cache if outcome_cache is not None else self._shared_outcome_cache
+
+    @property
+    def _manager(self) -> GameManager:
+        if self._default_manager is not None:
+            return self._default_manager
+        return GameManager(self._session_id)
+
+    @property
+    def session_id(self):
+        return self._session_id
+
+    # -------- Metrics --------
+
+    def enable_metrics(self, window: int = 4096) -> Metrics:
+        if self._metrics is None:
+            self._metrics = Metrics(window)
+        return self._metrics
+
+    def disable_metrics(self) -> None:
+        self._metrics = None
+
+    def metrics_snapshot(self) -> Dict[str, dict]:
+        return {} if self._metrics is None else self._metrics.snapshot()
+
+    def _timed_ui_callback(self, ui_callback, sleep_time: float):
+        # Measures time spent in the UI hook and how late each frame arrives
+        # compared with its scheduled slot (start + n * sleep_time).
+        m = self._metrics
+        start = perf_counter()
+        frame = 0
+
+        def callback(text, hp1, hp2):
+            nonlocal frame
+            began = perf_counter()
+            m.observe("battle.frame_lateness", max(0.0, began - start - frame * sleep_time))
+            frame += 1
+            result = ui_callback(text, hp1, hp2)
+            if inspect.isawaitable(result):
+                # Async hooks do their work when awaited, so time that instead.
+                return timed_await(result, began)
+            m.observe("battle.ui_callback", perf_counter() - began)
+            return result
+
+        async def timed_await(awaitable, began):
+            result = await awaitable
+            m.observe("battle.ui_callback", perf_counter() - began)
+            return result
+
+        return callback
 
     # -------- Character creation --------
 
     def load_character_from_json(self, slot: int, json_data: dict, proto_key: str = "warrior") -> Character:
+        if self._metrics is not None:
+            return self._load_character_timed(slot, json_data, proto_key)
+
         adapter = JSONCharacterAdapter(json_data)
-        proto = self._prototypes.get_template(proto_key)
+        # apply_prototype only reads the template, so no copy is needed.
+        proto = self._prototypes.peek_template(proto_key)
 
         character = (
             self._builder
@@ -30,28 +101,171 @@ class GameFacade:
         self._manager.set_character(slot, character)
         return character
 
+    def _load_character_timed(self, slot: int, json_data: dict, proto_key: str) -> Character:
+        m = self._metrics
+        t0 = perf_counter()
+        self._builder.from_adapter(JSONCharacterAdapter(json_data))
+        t1 = perf_counter()
+        proto = self._prototypes.peek_template(proto_key)
+        t2 = perf_counter()
+        character = self._builder.apply_prototype(proto).build()
+        t3 = perf_counter()
+        self._manager.set_character(slot, character)
+        t4 = perf_counter()
+
+        m.observe("load.adapter", t1 - t0)
+        m.observe("load.prototype", t2 - t1)
+        m.observe("load.build", t3 - t2)
+        m.observe("load.total", t4 - t0)
+        return character
+
+    def add_to_roster(self, json_data: dict, proto_key: str = "warrior") -> int:
+        character = (
+            self._builder
+            .from_adapter(JSONCharacterAdapter(json_data))
+            .apply_prototype(self._prototypes.peek_template(proto_key))
+            .build()
+        )
+        return self._manager.roster.add(character)
+
+    def iter_characters_from_ndjson(self, source, proto_key: str = "warrior", batch_size: int = 1000,
+                                    skip_invalid: bool = False):
+        loader = NDJSONCharacterLoader(self._prototypes.peek_template(proto_key), batch_size,
+                                       skip_invalid=skip_invalid)
+        return loader.iter_characters(source)
+
+    def load_roster_from_ndjson(self, source, proto_key: str = "warrior",
+                                table: Optional[CharacterTable] = None, skip_invalid: bool = False) -> CharacterTable:
+        loader = NDJSONCharacterLoader(self._prototypes.peek_template(proto_key), skip_invalid=skip_invalid)
+        return loader.load_into(source, table)
+
     def get_character(self, slot: int) -> Optional[Character]:
         return self._manager.get_character(slot)
 
     # -------- Buffs (decorators) --------
 
     def apply_attack_boost(self, slot: int, bonus: int = 10) -> Character:
-        ch = self._manager.get_character(slot)
-        if ch is None:
-            raise RuntimeError(f"No character in slot {slot}")
-        boosted = AttackBoost(ch, bonus)
-        self._manager.set_character(slot, boosted)
-        return boosted
+        return self._add_buff(slot, AttackBoost, bonus)
 
     def apply_shield_boost(self, slot: int, shield: int = 20) -> Character:
-        ch = self._manager.get_character(slot)
-        if ch is None:
-            raise RuntimeError(f"No character in slot {slot}")
-        boosted = ShieldBoost(ch, shield)
-        self._manager.set_character(slot, boosted)
+        return self._add_buff(slot, ShieldBoost, shield)
+
+    def remove_last_buff(self, slot: int) -> Character:
+        def unwrap(ch):
+            chain = ch.chain if isinstance(ch, CompiledCharacter) else ch
+            if not isinstance(chain, CharacterDecorator):
+                raise RuntimeError(f"No buffs on character in slot {slot}")
+            return compile_chain(chain._wrapped)
+
+        if self._metrics is None:
+            return self._manager.update_character(slot, unwrap)
+        start = perf_counter()
+        unbuffed = self._manager.update_character(slot, unwrap)
+        self._metrics.observe("buff.remove", perf_counter() - start)
+        return unbuffed
+
+    def _add_buff(self, slot: int, decorator_cls, value: int) -> Character:
+        # Slots hold a compiled snapshot so battles never walk the decorator
+        # chain; the snapshot is only rebuilt when a buff is added or removed.
+        def wrap(ch):
+            if isinstance(ch, CompiledCharacter):
+                return ch.extend(decorator_cls(ch.chain, value))
+            return compile_chain(decorator_cls(ch, value))
+
+        if self._metrics is None:
+            return self._manager.update_character(slot, wrap)
+        start = perf_counter()
+        boosted = self._manager.update_character(slot, wrap)
+        self._metrics.observe("buff.apply", perf_counter() - start)
         return boosted
 
+    # -------- Battle events --------
+
+    def subscribe(self, observer: Observer, *event_types: str) -> None:
+        self._manager.events.subscribe(observer, *event_types)
+
+    def unsubscribe(self, observer: Observer, *event_types: str) -> None:
+        self._manager.events.unsubscribe(observer, *event_types)
+
+    def get_battle_log(self) -> List[str]:
+        return self._manager.battle_log.logs
+
     # -------- Battle --------
 
     def run_battle_realtime(self, ui_callback, sleep_time=0.7):
-        return self._manager.simulate_battle_realtime(ui_callback, sleep_time)
+        if self._metrics is None:
+            return self._manager.simulate_battle_realtime(ui_callback, sleep_time)
+        start = perf_counter()
+        result = self._manager.simulate_battle_realtime(self._timed_ui_callback(ui_callback, sleep_time), sleep_time)
+        self._metrics.observe("battle.realtime", perf_counter() - start)
+        return result
+
+    async def run_battle_realtime_async(self, ui_callback, sleep_time=0.7):
+        if self._metrics is None:
+            return await self._manager.simulate_battle_realtime_async(ui_callback, sleep_time)
+        start = perf_counter()
+        result = await self._manager.simulate_battle_realtime_async(
+            self._timed_ui_callback(ui_callback, sleep_time), sleep_time
+        )
+        self._metrics.observe("battle.realtime", perf_counter() - start)
+        return result
+
+    def iter_battle_realtime(self, sleep_time=0.7):
+        return self._manager.iter_battle_realtime(sleep_time)
+
+    async def run_arena_battle_async(self, id1: int, id2: int, ui_callback, sleep_time: float = 0.7) -> BattleResult:
+        return await self._manager.run_arena_battle_async(id1, id2, ui_callback, sleep_time)
+
+    def run_battle_headless(self, collect_logs: bool = False, max_turns: Optional[int] = None) -> BattleResult:
+        if self._metrics is None:
+            return self._manager.simulate_battle_headless(collect_logs, max_turns)
+        start = perf_counter()
+        result = self._manager.simulate_battle_headless(collect_logs, max_turns)
+        elapsed = perf_counter() - start
+        self._metrics.observe("battle.headless", elapsed)
+        if result.turns:
+            self._metrics.observe("battle.turn", elapsed / result.turns)
+        self._metrics.increment("battle.turns", result.turns)
+        return result
+
+    def run_arena_battle(self, id1: int, id2: int, ui_callback=None, sleep_time: float = 0.0) -> BattleResult:
+        return self._manager.run_arena_battle(id1, id2, ui_callback, sleep_time)
+
+    def submit_arena_battle(self, id1: int, id2: int, ui_callback=None, sleep_time: float = 0.0):
+        return self._manager.submit_arena_battle(id1, id2, ui_callback, sleep_time)
+
+    def run_battle_initiative(self, max_actions: Optional[int] = None) -> InitiativeResult:
+        return self._manager.simulate_battle_initiative(max_actions)
+
+    def run_raid(self, team_a, team_b, targeting: str = "spread", max_ticks: int = 10_000) -> RaidResult:
+        return run_raid(team_a, team_b, targeting, max_ticks)
+
+    def run_battle_cached(self, max_turns: Optional[int] = None) -> BattleResult:
+        # Outcome of the current matchup without touching either fighter.
+        ch1, ch2 = self._manager.get_character(1), self._manager.get_character(2)
+        if ch1 is None or ch2 is None:
+            raise RuntimeError("Both slots must be loaded before a battle")
+        return self._outcome_cache.get_or_compute(ch1, ch2, max_turns)
+
+    def invalidate_outcome_cache(self) -> int:
+        return self._outcome_cache.invalidate()
+
+    def outcome_cache_stats(self) -> dict:
+        return self._outcome_cache.stats()
+
+    def predict_battle(self, max_turns: Optional[int] = None) -> BattleResult:
+        return self._manager.predict_battle(max_turns)
+
+    def estimate_win_probability(self, battles: int = 10_000, seed: Optional[int] = None,
+                                 variance: VarianceModel = VarianceModel()) -> WinEstimate:
+        return estimate_win_probability(
+            self._manager.get_character(1), self._manager.get_character(2), battles, seed, variance
+        )
+
+    # -------- Replays --------
+
+    def record_battle(self, max_turns: Optional[int] = None) -> bytes:
+        return record_battle(self._manager.get_character(1), self._manager.get_character(2), max_turns)
+
+    def replay_battle(self, replay: BattleReplay, ui_callback, sleep_time=0.7, speed: float = 1.0) -> None:
+        replay.play(ui_callback, sleep_time, speed)
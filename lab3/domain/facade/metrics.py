@@ -0,0 +1,58 @@
+import threading
+from collections import deque
+from typing import Dict
+
+
+class _Series:
+    __slots__ = ("count", "total", "samples")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total = 0.0
+        self.samples: deque = deque(maxlen=window)
+
+
+class Metrics:
+    """Counters and latency timers; percentiles are taken over the last ``window`` samples."""
+
+    def __init__(self, window: int = 4096):
+        self._window = window
+        self._lock = threading.Lock()
+        self._series: Dict[str, _Series] = {}
+        self._counters: Dict[str, int] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series(self._window)
+            series.count += 1
+            series.total += seconds
+            series.samples.append(seconds)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            series = {name: (s.count, s.total, sorted(s.samples)) for name, s in self._series.items()}
+            counters = dict(self._counters)
+
+        result: Dict[str, dict] = {}
+        for name, (count, total, samples) in sorted(series.items()):
+            result[name] = {
+                "count": count,
+                "total_ms": total * 1e3,
+                "mean_ms": total / count * 1e3,
+                "p50_ms": samples[len(samples) // 2] * 1e3,
+                "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e3,
+            }
+        for name, value in sorted(counters.items()):
+            result[name] = {"count": value}
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._counters.clear()
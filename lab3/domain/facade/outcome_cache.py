@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from domain.models.battle_result import BattleResult
+from domain.singleton.battle_solver import DuelProfile, duel_profile, solve_profiles
+
+CacheKey = Tuple[DuelProfile, DuelProfile, Optional[int]]
+
+
+class BattleOutcomeCache:
+    """LRU cache of battle outcomes keyed by both fighters' fully resolved stats.
+
+    Keys are DuelProfiles (effective health curve and attack after every
+    decorator), so names and decorator layout don't matter, only the numbers
+    that decide the fight.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, BattleResult]" = OrderedDict()
+        self._by_profile: Dict[DuelProfile, Set[CacheKey]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, ch1, ch2, max_turns: Optional[int] = None) -> BattleResult:
+        p1, p2 = duel_profile(ch1), duel_profile(ch2)
+        key = (p1, p2, max_turns)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = solve_profiles(p1, p2, max_turns)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = result
+                self._by_profile.setdefault(p1, set()).add(key)
+                self._by_profile.setdefault(p2, set()).add(key)
+                while len(self._entries) > self._maxsize:
+                    self._drop(next(iter(self._entries)))
+        return result
+
+    def _drop(self, key: CacheKey) -> None:
+        del self._entries[key]
+        for profile in (key[0], key[1]):
+            keys = self._by_profile.get(profile)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_profile[profile]
+
+    def invalidate(self, profile: Optional[DuelProfile] = None) -> int:
+        # Drops every outcome involving `profile`, or everything when None.
+        with self._lock:
+            if profile is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._by_profile.clear()
+                return dropped
+            keys = list(self._by_profile.get(profile, ()))
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -1 +1,4 @@
 from .character import Character
+from .slotted_character import SlottedCharacter
+from .character_table import CharacterTable, CharacterRow
+from .battle_result import BattleResult
@@ -0,0 +1,9 @@
+from typing import List, NamedTuple, Optional
+
+
+class BattleResult(NamedTuple):
+    winner_slot: int
+    turns: int
+    hp1: int
+    hp2: int
+    logs: Optional[List[str]] = None
@@ -24,6 +24,10 @@ class Character:
         self._health -= amount
 
     def clone(self) -> "Character":
+        # All fields are immutable scalars, so a plain Character can skip
+        # deepcopy's memo/reduce machinery. Decorator chains still deep copy.
+        if type(self) is Character:
+            return Character(self._name, self._health, self._attack, self._speed)
         return deepcopy(self)
 
     def to_dict(self) -> dict:
@@ -0,0 +1,85 @@
+from array import array
+from typing import Iterable, Iterator, List
+
+from .slotted_character import SlottedCharacter
+
+
+class CharacterTable:
+    """Struct-of-arrays roster: one typed column per stat instead of one object per character."""
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._health = array("q")
+        self._attack = array("q")
+        self._speed = array("q")
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index: int) -> "CharacterRow":
+        if index < 0:
+            index += len(self._names)
+        if not 0 <= index < len(self._names):
+            raise IndexError("CharacterTable index out of range")
+        return CharacterRow(self, index)
+
+    def __iter__(self) -> Iterator["CharacterRow"]:
+        for index in range(len(self._names)):
+            yield CharacterRow(self, index)
+
+    def append(self, name: str, health: int, attack: int, speed: int) -> "CharacterRow":
+        self._names.append(name)
+        self._health.append(health)
+        self._attack.append(attack)
+        self._speed.append(speed)
+        return CharacterRow(self, len(self._names) - 1)
+
+    def add(self, character) -> "CharacterRow":
+        return self.append(
+            character.get_name(), character.get_health(), character.get_attack(), character.get_speed()
+        )
+
+    def extend(self, characters: Iterable) -> None:
+        for character in characters:
+            self.add(character)
+
+
+class CharacterRow:
+    """Character-compatible view of one CharacterTable row; mutations write through to the table."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: CharacterTable, index: int):
+        self._table = table
+        self._index = index
+
+    def get_name(self) -> str:
+        return self._table._names[self._index]
+
+    def get_health(self) -> int:
+        return max(0, self._table._health[self._index])
+
+    def get_attack(self) -> int:
+        return self._table._attack[self._index]
+
+    def get_speed(self) -> int:
+        return self._table._speed[self._index]
+
+    def take_damage(self, amount: int) -> None:
+        self._table._health[self._index] -= amount
+
+    def clone(self) -> SlottedCharacter:
+        t, i = self._table, self._index
+        return SlottedCharacter(t._names[i], t._health[i], t._attack[i], t._speed[i])
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.get_name(),
+            "health": self.get_health(),
+            "attack": self.get_attack(),
+            "speed": self.get_speed(),
+        }
+
+    def __repr__(self) -> str:
+        t, i = self._table, self._index
+        return f"CharacterRow({t._names[i]}, hp={t._health[i]}, atk={t._attack[i]}, spd={t._speed[i]})"
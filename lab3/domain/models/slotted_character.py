@@ -0,0 +1,22 @@
+from .character import Character
+
+
+class SlottedCharacter:
+    # Deliberately not a Character subclass: inheriting would bring back the
+    # per-instance __dict__ that __slots__ is meant to remove. Behaviour is
+    # shared by reusing Character's methods.
+    __slots__ = ("_name", "_health", "_attack", "_speed")
+
+    __init__ = Character.__init__
+    get_name = Character.get_name
+    get_health = Character.get_health
+    get_attack = Character.get_attack
+    get_speed = Character.get_speed
+    take_damage = Character.take_damage
+    to_dict = Character.to_dict
+
+    def clone(self) -> "SlottedCharacter":
+        return SlottedCharacter(self._name, self._health, self._attack, self._speed)
+
+    def __repr__(self) -> str:
+        return f"SlottedCharacter({self._name}, hp={self._health}, atk={self._attack}, spd={self._speed})"
@@ -1 +1,2 @@
 from .character_prototype import CharacterPrototypeManager
+from .copy_on_write import CopyOnWriteCharacter
@@ -1,4 +1,5 @@
 from domain.models.character import Character
+from .copy_on_write import CopyOnWriteCharacter
 
 
 class CharacterPrototypeManager:
@@ -8,8 +9,15 @@ class CharacterPrototypeManager:
             "mage": Character("MageTemplate", 40, 25, 7),
         }
 
-    def get_template(self, key: str) -> Character:
+    def get_template(self, key: str, copy_on_write: bool = False) -> Character:
+        template = self.peek_template(key)
+        if copy_on_write:
+            return CopyOnWriteCharacter(template)
+        return template.clone()
+
+    def peek_template(self, key: str) -> Character:
+        # Shared instance: callers must treat it as read-only.
         template = self._templates.get(key)
         if not template:
             raise ValueError(f"No template registered for key: {key}")
-        return template.clone()
+        return template
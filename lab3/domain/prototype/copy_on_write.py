@@ -0,0 +1,42 @@
+class CopyOnWriteCharacter:
+    """Read-through view of a template that only clones it on the first write."""
+
+    __slots__ = ("_source", "_owned")
+
+    def __init__(self, source):
+        self._source = source
+        self._owned = False
+
+    def _own(self):
+        if not self._owned:
+            self._source = self._source.clone()
+            self._owned = True
+        return self._source
+
+    @property
+    def is_copied(self) -> bool:
+        return self._owned
+
+    def get_name(self) -> str:
+        return self._source.get_name()
+
+    def get_health(self) -> int:
+        return self._source.get_health()
+
+    def get_attack(self) -> int:
+        return self._source.get_attack()
+
+    def get_speed(self) -> int:
+        return self._source.get_speed()
+
+    def take_damage(self, amount: int) -> None:
+        self._own().take_damage(amount)
+
+    def clone(self):
+        return self._source.clone()
+
+    def to_dict(self) -> dict:
+        return self._source.to_dict()
+
+    def __repr__(self) -> str:
+        return f"CopyOnWriteCharacter({self._source!r}, copied={self._owned})"
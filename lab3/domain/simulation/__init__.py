@@ -0,0 +1,5 @@
+from .monte_carlo import VarianceModel, WinEstimate, estimate_win_probability
+from .tournament import MatchResult, Standing, pairing_count, pair_at, run_round_robin, rank_roster
+from .replay import BattleReplay, FighterHeader, record_battle, write_replay
+from .initiative import InitiativeAction, InitiativeResult, InitiativeScheduler, run_initiative_battle
+from .raid import RaidResult, run_raid, team_arrays
@@ -0,0 +1,120 @@
+import heapq
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class InitiativeScheduler:
+    """Speed-driven turn order: a combatant with speed s acts at times 1/s, 2/s, 3/s, ...
+
+    Each action is one heap pop and push, O(log n). Ties go to the lower
+    index, so equal speeds reduce to plain round-robin alternation.
+    """
+
+    def __init__(self, speeds: Sequence[int]):
+        self._speeds = list(speeds)
+        self._counts = [1] * len(self._speeds)
+        self._removed = set()
+        # count / speed is computed from integers each time rather than
+        # accumulated, so equal rational times compare equal as floats.
+        self._heap: List[Tuple[float, int]] = [(1 / s, i) for i, s in enumerate(self._speeds) if s > 0]
+        heapq.heapify(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def next(self) -> Optional[int]:
+        heap = self._heap
+        while heap:
+            _, index = heapq.heappop(heap)
+            if index in self._removed:
+                continue
+            self._counts[index] += 1
+            heapq.heappush(heap, (self._counts[index] / self._speeds[index], index))
+            return index
+        return None
+
+    def remove(self, index: int) -> None:
+        # Lazy deletion: the entry is skipped when it reaches the top.
+        self._removed.add(index)
+
+
+class InitiativeAction(NamedTuple):
+    actor: int
+    target: int
+    damage: int
+    target_hp: int
+
+
+class InitiativeResult(NamedTuple):
+    winner_team: Optional[object]
+    actions: int
+    final_hp: List[int]
+    log: Optional[List[InitiativeAction]] = None
+
+
+def run_initiative_battle(combatants: Sequence, teams: Optional[Sequence] = None, use_speed: bool = True,
+                          max_actions: Optional[int] = None, collect_log: bool = False) -> InitiativeResult:
+    """Battle between any number of combatants grouped into teams.
+
+    Without ``teams`` every combatant fights for itself. Each actor strikes
+    the first living member of the first other team still standing. With
+    ``use_speed=False``, or equal speeds, two combatants alternate exactly
+    like simulate_battle_realtime.
+    """
+    n = len(combatants)
+    teams = list(range(n)) if teams is None else list(teams)
+    if len(teams) != n:
+        raise ValueError("teams must name one team per combatant")
+
+    members: Dict[object, List[int]] = {}
+    for index, team in enumerate(teams):
+        members.setdefault(team, []).append(index)
+
+    alive = [ch.get_health() > 0 for ch in combatants]
+    # Next candidate target per team; only ever moves forward past the dead.
+    first_alive = {team: 0 for team in members}
+    alive_teams: Dict[object, None] = {}
+    for team, indexes in members.items():
+        while first_alive[team] < len(indexes) and not alive[indexes[first_alive[team]]]:
+            first_alive[team] += 1
+        if first_alive[team] < len(indexes):
+            alive_teams[team] = None
+
+    speeds = [ch.get_speed() if use_speed else 1 for ch in combatants]
+    scheduler = InitiativeScheduler(speeds)
+    for index in range(n):
+        if not alive[index]:
+            scheduler.remove(index)
+
+    attacks = [ch.get_attack() for ch in combatants]
+    log: Optional[List[InitiativeAction]] = [] if collect_log else None
+    actions = 0
+
+    while len(alive_teams) > 1 and (max_actions is None or actions < max_actions):
+        actor = scheduler.next()
+        if actor is None:
+            break
+
+        actor_team = teams[actor]
+        for target_team in alive_teams:
+            if target_team != actor_team:
+                break
+        target = members[target_team][first_alive[target_team]]
+
+        defender = combatants[target]
+        defender.take_damage(attacks[actor])
+        hp = defender.get_health()
+        actions += 1
+        if log is not None:
+            log.append(InitiativeAction(actor, target, attacks[actor], hp))
+
+        if hp <= 0:
+            alive[target] = False
+            scheduler.remove(target)
+            indexes = members[target_team]
+            while first_alive[target_team] < len(indexes) and not alive[indexes[first_alive[target_team]]]:
+                first_alive[target_team] += 1
+            if first_alive[target_team] == len(indexes):
+                del alive_teams[target_team]
+
+    winner = next(iter(alive_teams)) if len(alive_teams) == 1 else None
+    return InitiativeResult(winner, actions, [ch.get_health() for ch in combatants], log)
@@ -0,0 +1,116 @@
+import math
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from domain.singleton.battle_solver import DuelProfile, duel_profile
+
+
+class VarianceModel(NamedTuple):
+    crit_chance: float = 0.1
+    crit_multiplier: float = 2.0
+    # Each hit rolls attack * uniform(1 - spread, 1 + spread) before crits.
+    damage_spread: float = 0.2
+    # When set, slot 1 strikes first with probability speed1 / (speed1 + speed2);
+    # otherwise slot 1 always opens, as in simulate_battle_realtime.
+    speed_initiative: bool = True
+
+
+class WinEstimate(NamedTuple):
+    battles: int
+    win_rate: float
+    win_rate_ci: Tuple[float, float]
+    mean_turns: float
+    mean_turns_ci: Tuple[float, float]
+    turn_histogram: np.ndarray
+    unfinished: int
+
+
+def _roll_damage(rng, attack: int, shape, variance: VarianceModel) -> np.ndarray:
+    dmg = np.full(shape, float(attack))
+    if variance.damage_spread:
+        dmg *= rng.uniform(1 - variance.damage_spread, 1 + variance.damage_spread, shape)
+    if variance.crit_chance:
+        dmg = np.where(rng.random(shape) < variance.crit_chance, dmg * variance.crit_multiplier, dmg)
+    return np.rint(dmg).astype(np.int64)
+
+
+def _hits_to_kill(rng, n: int, defender: DuelProfile, attack: int, variance: VarianceModel,
+                  max_hits: int, block: int = 64) -> np.ndarray:
+    # Hits needed per battle; max_hits + 1 marks "not within the turn limit".
+    hits = np.full(n, max_hits + 1, dtype=np.int64)
+    if defender.floor > 0 or attack <= 0:
+        return hits
+
+    dealt = np.zeros(n, dtype=np.int64)
+    pending = np.arange(n)
+    done = 0
+    while pending.size and done < max_hits:
+        k = min(block, max_hits - done)
+        total = dealt[pending, None] + np.cumsum(_roll_damage(rng, attack, (pending.size, k), variance), axis=1)
+        killed = total >= defender.base_hp
+        landed = killed.any(axis=1)
+
+        hits[pending[landed]] = done + killed[landed].argmax(axis=1) + 1
+        dealt[pending] = total[:, -1]
+        pending = pending[~landed]
+        done += k
+
+    return hits
+
+
+def _wilson(successes: int, n: int, z: float) -> Tuple[float, float]:
+    if n == 0:
+        return 0.0, 0.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def estimate_win_probability(ch1, ch2, battles: int = 10_000, seed: Optional[int] = None,
+                             variance: VarianceModel = VarianceModel(), max_turns: int = 1000,
+                             z: float = 1.96) -> WinEstimate:
+    rng = np.random.default_rng(seed)
+    p1, p2 = duel_profile(ch1), duel_profile(ch2)
+    alive1 = p1.floor > 0 or p1.base_hp > 0
+    alive2 = p2.floor > 0 or p2.base_hp > 0
+
+    if not alive1 or not alive2:
+        turns = np.zeros(battles, dtype=np.int64)
+        winner1 = np.full(battles, alive1)
+        finished = np.ones(battles, dtype=bool)
+    else:
+        max_hits = (max_turns + 1) // 2
+        n1 = _hits_to_kill(rng, battles, p2, p1.attack, variance, max_hits)
+        n2 = _hits_to_kill(rng, battles, p1, p2.attack, variance, max_hits)
+
+        if variance.speed_initiative:
+            s1, s2 = max(0, ch1.get_speed()), max(0, ch2.get_speed())
+            p_first = s1 / (s1 + s2) if s1 + s2 else 0.5
+            first1 = rng.random(battles) < p_first
+        else:
+            first1 = np.ones(battles, dtype=bool)
+
+        # The opener's n-th hit lands on turn 2n - 1, the other side's on 2n.
+        end1 = np.where(first1, 2 * n1 - 1, 2 * n1)
+        end2 = np.where(first1, 2 * n2, 2 * n2 - 1)
+        turns = np.minimum(end1, end2)
+        finished = turns <= max_turns
+        winner1 = finished & (end1 < end2)
+
+    wins = int(winner1.sum())
+    done_turns = turns[finished]
+    mean = float(done_turns.mean()) if done_turns.size else 0.0
+    half = z * float(done_turns.std(ddof=1)) / math.sqrt(done_turns.size) if done_turns.size > 1 else 0.0
+
+    return WinEstimate(
+        battles=battles,
+        win_rate=wins / battles if battles else 0.0,
+        win_rate_ci=_wilson(wins, battles, z),
+        mean_turns=mean,
+        mean_turns_ci=(mean - half, mean + half),
+        turn_histogram=np.bincount(done_turns, minlength=1),
+        unfinished=int(battles - finished.sum()),
+    )
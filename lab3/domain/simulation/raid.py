@@ -0,0 +1,88 @@
+from typing import NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from domain.singleton.battle_solver import duel_profile
+
+TARGETING = ("spread", "focus")
+
+
+class RaidResult(NamedTuple):
+    # 1 or 2 for the winning team, 0 when both fall together or max_ticks runs out.
+    winner_team: int
+    ticks: int
+    hp_a: np.ndarray
+    hp_b: np.ndarray
+    survivors_a: int
+    survivors_b: int
+
+
+def team_arrays(characters: Sequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Decorator stacks resolve through duel_profile, so a unit's health is
+    # max(floor, base_hp - damage dealt), exactly as with take_damage.
+    profiles = [duel_profile(ch) for ch in characters]
+    base_hp = np.fromiter((p.base_hp for p in profiles), dtype=np.int64, count=len(profiles))
+    floor = np.fromiter((p.floor for p in profiles), dtype=np.int64, count=len(profiles))
+    attack = np.fromiter((p.attack for p in profiles), dtype=np.int64, count=len(profiles))
+    return base_hp, floor, attack
+
+
+def _strike(attacker_alive: np.ndarray, attack: np.ndarray, defender_alive: np.ndarray,
+            targeting: str) -> np.ndarray:
+    damage = attack[attacker_alive]
+    pool = np.flatnonzero(defender_alive)
+    if targeting == "spread":
+        targets = pool[np.arange(damage.size) % pool.size]
+    else:
+        targets = np.full(damage.size, pool[0])
+    return np.bincount(targets, weights=damage, minlength=defender_alive.size).astype(np.int64)
+
+
+def run_raid(team_a: Sequence, team_b: Sequence, targeting: str = "spread", max_ticks: int = 10_000,
+             apply_damage: bool = False) -> RaidResult:
+    """Team battle where every living unit strikes once per tick, simultaneously.
+
+    ``spread`` has the k-th living attacker hit the k-th living enemy (mod the
+    number alive); ``focus`` sends every hit to the first living enemy. With
+    ``apply_damage`` each unit's total damage is written back with one
+    take_damage call at the end.
+    """
+    if targeting not in TARGETING:
+        raise ValueError(f"targeting must be one of {TARGETING}")
+
+    base_a, floor_a, atk_a = team_arrays(team_a)
+    base_b, floor_b, atk_b = team_arrays(team_b)
+    dealt_a = np.zeros_like(base_a)
+    dealt_b = np.zeros_like(base_b)
+
+    ticks = 0
+    while True:
+        alive_a = (floor_a > 0) | (base_a - dealt_a > 0)
+        alive_b = (floor_b > 0) | (base_b - dealt_b > 0)
+        if not alive_a.any() or not alive_b.any() or ticks >= max_ticks:
+            break
+        hits_b = _strike(alive_a, atk_a, alive_b, targeting)
+        hits_a = _strike(alive_b, atk_b, alive_a, targeting)
+        dealt_a += hits_a
+        dealt_b += hits_b
+        ticks += 1
+
+    any_a, any_b = bool(alive_a.any()), bool(alive_b.any())
+    winner = 1 if any_a and not any_b else 2 if any_b and not any_a else 0
+
+    if apply_damage:
+        for ch, dealt in zip(team_a, dealt_a.tolist()):
+            if dealt:
+                ch.take_damage(dealt)
+        for ch, dealt in zip(team_b, dealt_b.tolist()):
+            if dealt:
+                ch.take_damage(dealt)
+
+    return RaidResult(
+        winner_team=winner,
+        ticks=ticks,
+        hp_a=np.maximum(floor_a, base_a - dealt_a),
+        hp_b=np.maximum(floor_b, base_b - dealt_b),
+        survivors_a=int(alive_a.sum()),
+        survivors_b=int(alive_b.sum()),
+    )
@@ -0,0 +1,232 @@
+"""Compact binary battle replays.
+
+Layout (little-endian):
+
+    header   "<4sHBI"  magic, version, winner slot, turn count
+    fighter  x2        "<H" name length, UTF-8 name,
+                       "<iiiii" base health, base attack, speed, start HP, effective attack,
+                       "<H" buff count, then "<Bi" (kind, value) per buff, innermost first
+    padding            to a 4-byte boundary
+    columns            damage int32[n], hp_after int32[n], attacker uint8[n]
+"""
+import mmap
+import struct
+import sys
+import time
+from array import array
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from domain.decorator import AttackBoost, CharacterDecorator, CompiledCharacter, ShieldBoost
+from domain.singleton.battle_solver import duel_profile, solve_profiles
+
+MAGIC = b"RPLY"
+VERSION = 1
+BUFF_ATTACK = 1
+BUFF_SHIELD = 2
+
+_HEADER = struct.Struct("<4sHBI")
+_NAME_LEN = struct.Struct("<H")
+_STATS = struct.Struct("<iiiii")
+_BUFF_COUNT = struct.Struct("<H")
+_BUFF = struct.Struct("<Bi")
+
+
+class FighterHeader(NamedTuple):
+    name: str
+    base_health: int
+    base_attack: int
+    speed: int
+    start_hp: int
+    attack: int
+    buffs: Tuple[Tuple[int, int], ...]
+
+
+def _buff_stack(ch) -> Tuple[object, Tuple[Tuple[int, int], ...]]:
+    buffs = []
+    node = ch
+    while isinstance(node, CharacterDecorator):
+        if isinstance(node, CompiledCharacter):
+            node = node.chain
+            continue
+        if type(node) is AttackBoost:
+            buffs.append((BUFF_ATTACK, node._bonus))
+        elif type(node) is ShieldBoost:
+            buffs.append((BUFF_SHIELD, node._shield))
+        else:
+            raise ValueError(f"Cannot record decorator {type(node).__name__}")
+        node = node._wrapped
+    return node, tuple(reversed(buffs))
+
+
+def _fighter_header(ch) -> FighterHeader:
+    base, buffs = _buff_stack(ch)
+    return FighterHeader(ch.get_name(), base.get_health(), base.get_attack(), ch.get_speed(),
+                         ch.get_health(), ch.get_attack(), buffs)
+
+
+def _native(column: array) -> array:
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+def record_battle(ch1, ch2, max_turns: Optional[int] = None) -> bytes:
+    # Duels are deterministic, so the turn stream is derived from the fighters'
+    # duel profiles without running (or damaging) the characters themselves.
+    p1, p2 = duel_profile(ch1), duel_profile(ch2)
+    result = solve_profiles(p1, p2, max_turns)
+    n = result.turns
+
+    damage = array("i", bytes(4 * n))
+    hp_after = array("i", bytes(4 * n))
+    attacker = array("B", bytes(n))
+    for turn in range(n):
+        hits = turn // 2 + 1
+        if turn % 2 == 0:
+            attacker[turn] = 1
+            damage[turn] = p1.attack
+            hp_after[turn] = max(p2.floor, p2.base_hp - hits * p1.attack)
+        else:
+            attacker[turn] = 2
+            damage[turn] = p2.attack
+            hp_after[turn] = max(p1.floor, p1.base_hp - hits * p2.attack)
+
+    fighters = [_fighter_header(ch1), _fighter_header(ch2)]
+    names = [f.name.encode("utf-8") for f in fighters]
+    header_size = _HEADER.size + sum(
+        _NAME_LEN.size + len(name) + _STATS.size + _BUFF_COUNT.size + _BUFF.size * len(f.buffs)
+        for f, name in zip(fighters, names)
+    )
+    columns_at = (header_size + 3) & ~3
+
+    buf = bytearray(columns_at + 9 * n)
+    _HEADER.pack_into(buf, 0, MAGIC, VERSION, result.winner_slot, n)
+    offset = _HEADER.size
+    for f, name in zip(fighters, names):
+        _NAME_LEN.pack_into(buf, offset, len(name))
+        offset += _NAME_LEN.size
+        buf[offset:offset + len(name)] = name
+        offset += len(name)
+        _STATS.pack_into(buf, offset, f.base_health, f.base_attack, f.speed, f.start_hp, f.attack)
+        offset += _STATS.size
+        _BUFF_COUNT.pack_into(buf, offset, len(f.buffs))
+        offset += _BUFF_COUNT.size
+        for kind, value in f.buffs:
+            _BUFF.pack_into(buf, offset, kind, value)
+            offset += _BUFF.size
+
+    view = memoryview(buf)
+    view[columns_at:columns_at + 4 * n] = _native(damage).tobytes()
+    view[columns_at + 4 * n:columns_at + 8 * n] = _native(hp_after).tobytes()
+    view[columns_at + 8 * n:] = attacker.tobytes()
+    return bytes(buf)
+
+
+def write_replay(path: str, ch1, ch2, max_turns: Optional[int] = None) -> int:
+    data = record_battle(ch1, ch2, max_turns)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+class BattleReplay:
+    """Zero-copy reader over replay bytes or an mmap'd replay file."""
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, self.winner_slot, n = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a battle replay")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        offset = _HEADER.size
+        fighters: List[FighterHeader] = []
+        for _ in range(2):
+            (name_len,) = _NAME_LEN.unpack_from(view, offset)
+            offset += _NAME_LEN.size
+            name = bytes(view[offset:offset + name_len]).decode("utf-8")
+            offset += name_len
+            stats = _STATS.unpack_from(view, offset)
+            offset += _STATS.size
+            (buff_count,) = _BUFF_COUNT.unpack_from(view, offset)
+            offset += _BUFF_COUNT.size
+            buffs = tuple(_BUFF.unpack_from(view, offset + i * _BUFF.size) for i in range(buff_count))
+            offset += buff_count * _BUFF.size
+            fighters.append(FighterHeader(name, *stats, buffs))
+        self.fighters = tuple(fighters)
+
+        at = (offset + 3) & ~3
+        self.turns = n
+        if sys.byteorder == "little":
+            self.damage = view[at:at + 4 * n].cast("i")
+            self.hp_after = view[at + 4 * n:at + 8 * n].cast("i")
+        else:
+            self.damage = _native(array("i", bytes(view[at:at + 4 * n])))
+            self.hp_after = _native(array("i", bytes(view[at + 4 * n:at + 8 * n])))
+        self.attacker = view[at + 8 * n:at + 9 * n]
+
+    @classmethod
+    def open(cls, path: str) -> "BattleReplay":
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self) -> None:
+        # Views must be released before the underlying mmap can close.
+        for view in (self.damage, self.hp_after, self.attacker):
+            if isinstance(view, memoryview):
+                view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "BattleReplay":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        # Start frame, one per turn, and the closing frame.
+        return self.turns + 2
+
+    def frame(self, index: int) -> Tuple[str, int, int]:
+        # O(1) scrubbing: turns alternate, so the fighter that did not just
+        # take a hit still has the HP it was left with one turn earlier.
+        size = len(self)
+        if not -size <= index < size:
+            raise IndexError("replay frame index out of range")
+        index %= size
+        f1, f2 = self.fighters
+        if index == 0:
+            return f"Battle begins between {f1.name} and {f2.name}", f1.start_hp, f2.start_hp
+
+        turn = min(index - 1, self.turns - 1)
+        if turn < 0:
+            hp1, hp2 = f1.start_hp, f2.start_hp
+        else:
+            attacker = self.attacker[turn]
+            previous = self.hp_after[turn - 1] if turn > 0 else (f1.start_hp if attacker == 1 else f2.start_hp)
+            if attacker == 1:
+                hp1, hp2 = previous, self.hp_after[turn]
+            else:
+                hp1, hp2 = self.hp_after[turn], previous
+
+        if index <= self.turns:
+            atk, df = (f1, f2) if self.attacker[turn] == 1 else (f2, f1)
+            return (f"{atk.name} hits {df.name} for {self.damage[turn]} damage! "
+                    f"(HP now {self.hp_after[turn]})"), hp1, hp2
+
+        winner = {1: f1.name, 2: f2.name}.get(self.winner_slot)
+        return (f"Winner: {winner}" if winner else "Battle stopped at turn limit"), hp1, hp2
+
+    def play(self, ui_update_callback, sleep_time: float = 0.7, speed: float = 1.0,
+             start: int = 0, stop: Optional[int] = None) -> None:
+        # Drives the same (text, hp1, hp2) callback as the live battle;
+        # speed scales the per-turn delay, and speed <= 0 plays without pauses.
+        stop = len(self) if stop is None else min(stop, len(self))
+        delay = sleep_time / speed if speed > 0 else 0.0
+        for index in range(start, stop):
+            ui_update_callback(*self.frame(index))
+            if delay and index < stop - 1:
+                time.sleep(delay)
@@ -0,0 +1,127 @@
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from domain.singleton.battle_solver import DuelProfile, duel_profile, solve_profiles
+
+
+class MatchResult(NamedTuple):
+    first: int
+    second: int
+    # 0 is a draw: a fight neither side can ever win (turns 0), or one cut off at max_turns.
+    winner_slot: int
+    turns: int
+
+
+class Standing(NamedTuple):
+    index: int
+    name: str
+    wins: int
+    losses: int
+    draws: int
+
+
+# Set once per worker by the pool initializer, so tasks only carry index ranges.
+_profiles: Optional[Sequence[DuelProfile]] = None
+
+
+def _init_worker(profiles: Sequence[DuelProfile]) -> None:
+    global _profiles
+    _profiles = profiles
+
+
+def pairing_count(n: int) -> int:
+    return n * (n - 1) // 2
+
+
+def pair_at(k: int, n: int) -> Tuple[int, int]:
+    # Inverse of the row-major numbering of pairs (i, j) with i < j.
+    remaining = pairing_count(n) - 1 - k
+    row_from_end = (math.isqrt(8 * remaining + 1) - 1) // 2
+    i = n - 2 - row_from_end
+    j = k - (pairing_count(n) - pairing_count(n - i)) + i + 1
+    return i, j
+
+
+def _fight_range(start: int, stop: int, max_turns: Optional[int]) -> Tuple[int, array, array]:
+    profiles = _profiles
+    n = len(profiles)
+    winners = array("b")
+    turns = array("q")
+    i, j = pair_at(start, n)
+    for _ in range(stop - start):
+        try:
+            result = solve_profiles(profiles[i], profiles[j], max_turns)
+            winners.append(result.winner_slot)
+            turns.append(result.turns)
+        except ValueError:
+            # Only raised without max_turns, when shields keep both sides alive forever.
+            winners.append(0)
+            turns.append(0)
+        j += 1
+        if j == n:
+            i += 1
+            j = i + 1
+    return start, winners, turns
+
+
+def _chunks(total: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, total, chunk_size):
+        yield start, min(total, start + chunk_size)
+
+
+def run_round_robin(roster: Sequence, workers: Optional[int] = None, chunk_size: int = 20_000,
+                    max_turns: Optional[int] = None) -> Iterator[MatchResult]:
+    # The solver is O(1) per fight, so by default every fight runs to its end
+    # under the same rules as simulate_battle_realtime; max_turns caps it.
+    profiles = [duel_profile(ch) for ch in roster]
+    n = len(profiles)
+    total = pairing_count(n)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or total <= chunk_size:
+        _init_worker(profiles)
+        batches = (_fight_range(start, stop, max_turns) for start, stop in _chunks(total, chunk_size))
+        yield from _expand(batches, n)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(profiles,)) as pool:
+        starts, stops = zip(*_chunks(total, chunk_size))
+        batches = pool.map(_fight_range, starts, stops, [max_turns] * len(starts))
+        yield from _expand(batches, n)
+
+
+def _expand(batches, n: int) -> Iterator[MatchResult]:
+    for start, winners, turns in batches:
+        i, j = pair_at(start, n)
+        for winner_slot, turn_count in zip(winners, turns):
+            yield MatchResult(i, j, winner_slot, turn_count)
+            j += 1
+            if j == n:
+                i += 1
+                j = i + 1
+
+
+def rank_roster(roster: Sequence, workers: Optional[int] = None, chunk_size: int = 20_000,
+                max_turns: Optional[int] = None) -> List[Standing]:
+    n = len(roster)
+    wins = [0] * n
+    losses = [0] * n
+    draws = [0] * n
+
+    for match in run_round_robin(roster, workers, chunk_size, max_turns):
+        if match.winner_slot == 1:
+            wins[match.first] += 1
+            losses[match.second] += 1
+        elif match.winner_slot == 2:
+            wins[match.second] += 1
+            losses[match.first] += 1
+        else:
+            draws[match.first] += 1
+            draws[match.second] += 1
+
+    standings = [Standing(i, roster[i].get_name(), wins[i], losses[i], draws[i]) for i in range(n)]
+    standings.sort(key=lambda s: (-s.wins, s.losses, s.index))
+    return standings
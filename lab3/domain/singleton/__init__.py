@@ -1 +1,6 @@
-from .game_manager import GameManager
+from .game_manager import GameManager, run_realtime_battle
+from .roster import Roster
+from .session_store import SessionStore
+from .async_battle import iter_battle_frames, run_realtime_battle_async
+from .headless_battle import run_headless_battle
+from .battle_solver import DuelProfile, duel_profile, solve_profiles, solve_battle
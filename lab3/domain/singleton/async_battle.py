@@ -0,0 +1,68 @@
+import asyncio
+import inspect
+from typing import AsyncIterator, Optional, Tuple
+
+from domain.behavioral.observer import Subject
+
+
+async def iter_battle_frames(ch1, ch2, sleep_time: float = 0.7,
+                             events: Optional[Subject] = None) -> AsyncIterator[Tuple[str, int, int]]:
+    # Yields (text, hp1, hp2) per turn with the same rules and pacing as the
+    # realtime loop. Waits target absolute deadlines, so time spent in the
+    # consumer's UI hook does not accumulate as drift.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    # Event payloads are only built when someone is listening for that type.
+    publish_attacks = events is not None and events.has_subscribers("attack")
+
+    if events is not None and events.has_subscribers("battle_started"):
+        events.notify("battle_started", {"char1": ch1, "char2": ch2})
+
+    yield f"Battle begins between {ch1.get_name()} and {ch2.get_name()}", ch1.get_health(), ch2.get_health()
+
+    turn = 0
+    while ch1.get_health() > 0 and ch2.get_health() > 0:
+        deadline += sleep_time
+        await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+        attacker = ch1 if turn % 2 == 0 else ch2
+        defender = ch2 if turn % 2 == 0 else ch1
+
+        damage = attacker.get_attack()
+        defender.take_damage(damage)
+        if publish_attacks:
+            events.notify("attack", {
+                "attacker": attacker,
+                "defender": defender,
+                "damage": damage,
+                "defender_hp": defender.get_health(),
+            })
+
+        text = (
+            f"{attacker.get_name()} hits {defender.get_name()} "
+            f"for {damage} damage! (HP now {defender.get_health()})"
+        )
+        yield text, ch1.get_health(), ch2.get_health()
+
+        turn += 1
+
+    deadline += sleep_time
+    await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+    winner = ch1 if ch1.get_health() > 0 else ch2
+    if events is not None and events.has_subscribers("battle_finished"):
+        events.notify("battle_finished", {"winner": winner})
+    yield f"Winner: {winner.get_name()}", ch1.get_health(), ch2.get_health()
+
+
+async def run_realtime_battle_async(ch1, ch2, ui_update_callback, sleep_time: float = 0.7,
+                                    events: Optional[Subject] = None):
+    logs = []
+    async for text, hp1, hp2 in iter_battle_frames(ch1, ch2, sleep_time, events):
+        logs.append(text)
+        result = ui_update_callback(text, hp1, hp2)
+        if inspect.isawaitable(result):
+            await result
+
+    winner = ch1 if ch1.get_health() > 0 else ch2
+    return winner, logs
@@ -0,0 +1,84 @@
+from typing import NamedTuple, Optional
+
+from domain.decorator import CharacterDecorator, CompiledCharacter, ShieldBoost
+from domain.models.battle_result import BattleResult
+
+
+class DuelProfile(NamedTuple):
+    # Effective health after d total damage is max(floor, base_hp - d).
+    base_hp: int
+    floor: int
+    attack: int
+
+
+def duel_profile(ch) -> DuelProfile:
+    shields = []
+    node = ch
+    base_hp, floor = None, 0
+    while isinstance(node, CharacterDecorator):
+        if isinstance(node, CompiledCharacter):
+            base_hp = node._base.get_health() + node._health_offset
+            floor = node._health_floor
+            break
+        if isinstance(node, ShieldBoost):
+            shields.append(node._shield)
+        elif type(node).get_health is not CharacterDecorator.get_health \
+                or type(node).take_damage is not CharacterDecorator.take_damage:
+            raise ValueError(f"Cannot solve battles for decorator {type(node).__name__}")
+        node = node._wrapped
+    else:
+        base_hp = node.get_health()
+
+    # ShieldBoost computes max(0, inner + shield); composing those clamps from
+    # the innermost wrapper outwards keeps the max(floor, hp - d) shape.
+    for shield in reversed(shields):
+        base_hp += shield
+        floor = max(0, floor + shield)
+
+    return DuelProfile(base_hp, floor, ch.get_attack())
+
+
+def _hits_to_kill(defender: DuelProfile, attack: int) -> Optional[int]:
+    if defender.floor <= 0 and defender.base_hp <= 0:
+        return 0
+    if defender.floor > 0 or attack <= 0:
+        return None
+    return -(-defender.base_hp // attack)
+
+
+def _hp_after(profile: DuelProfile, hits: int, attack: int) -> int:
+    return max(profile.floor, profile.base_hp - hits * attack)
+
+
+def solve_profiles(p1: DuelProfile, p2: DuelProfile, max_turns: Optional[int] = None) -> BattleResult:
+    alive1 = _hits_to_kill(p1, p2.attack) != 0
+    alive2 = _hits_to_kill(p2, p1.attack) != 0
+    if not alive1 or not alive2:
+        return BattleResult(1 if alive1 else 2, 0, _hp_after(p1, 0, 0), _hp_after(p2, 0, 0))
+
+    # Slot 1 attacks on even turns, so its n-th hit lands on turn 2n - 1 and
+    # slot 2's n-th hit lands on turn 2n.
+    n1 = _hits_to_kill(p2, p1.attack)
+    n2 = _hits_to_kill(p1, p2.attack)
+    end1 = None if n1 is None else 2 * n1 - 1
+    end2 = None if n2 is None else 2 * n2
+
+    if end1 is not None and (end2 is None or end1 < end2):
+        winner_slot, turns = 1, end1
+    elif end2 is not None:
+        winner_slot, turns = 2, end2
+    elif max_turns is None:
+        raise ValueError("Battle never ends; pass max_turns to bound it")
+    else:
+        winner_slot, turns = 0, max_turns
+
+    if max_turns is not None and turns > max_turns:
+        winner_slot, turns = 0, max_turns
+
+    hp1 = _hp_after(p1, turns // 2, p2.attack)
+    hp2 = _hp_after(p2, (turns + 1) // 2, p1.attack)
+    return BattleResult(winner_slot, turns, hp1, hp2)
+
+
+def solve_battle(ch1, ch2, max_turns: Optional[int] = None) -> BattleResult:
+    return solve_profiles(duel_profile(ch1), duel_profile(ch2), max_turns)
@@ -1,56 +1,203 @@
-import time
+import asyncio
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Optional, Tuple
+
+from domain.behavioral.observer import BattleLogger, EventBus, Subject
+from domain.models.battle_result import BattleResult
+from domain.singleton.headless_battle import run_headless_battle
+from domain.singleton.battle_solver import solve_battle
+from domain.singleton.roster import Roster
+from domain.singleton.session_store import SessionStore
+from domain.singleton.async_battle import iter_battle_frames, run_realtime_battle_async
+from domain.simulation.initiative import InitiativeResult, run_initiative_battle
+
+
+def run_realtime_battle(ch1, ch2, ui_update_callback, sleep_time=0.7, events: Optional[Subject] = None):
+    def run():
+        return asyncio.run(run_realtime_battle_async(ch1, ch2, ui_update_callback, sleep_time, events))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return run()
+    # asyncio.run can't nest inside a running loop, so drive the battle on a
+    # helper thread; the caller still blocks as the sync loop always did.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="realtime-battle") as pool:
+        return pool.submit(run).result()
+
+
+def _sizeof(obj) -> int:
+    size = sys.getsizeof(obj)
+    attrs = getattr(obj, "__dict__", None)
+    return size if attrs is None else size + sys.getsizeof(attrs)
+
 
 class GameManager:
+    # GameManager() is the process-wide instance; GameManager(session_id)
+    # returns that session's own state from a bounded LRU/TTL store.
     _instance = None
+    _instance_lock = threading.Lock()
+    _sessions: Optional[SessionStore] = None
+    # Shared by every session so idle sessions don't each hold worker threads.
+    _arena_pool: Optional[ThreadPoolExecutor] = None
 
-    def __new__(cls):
-        if not cls._instance:
-            cls._instance = super().__new__(cls)
-            cls._instance._char1 = None
-            cls._instance._char2 = None
+    def __new__(cls, session_id=None):
+        if session_id is not None:
+            return cls.sessions().get_or_create(session_id)
+        with cls._instance_lock:
+            if not cls._instance:
+                cls._instance = cls._create()
         return cls._instance
 
+    @classmethod
+    def _create(cls) -> "GameManager":
+        manager = super().__new__(cls)
+        manager._roster = Roster()
+        manager._slots = {}
+        manager._slots_lock = threading.Lock()
+        manager._events = EventBus()
+        manager._battle_log = BattleLogger()
+        manager._events.subscribe(manager._battle_log)
+        return manager
+
+    @classmethod
+    def sessions(cls) -> SessionStore:
+        with cls._instance_lock:
+            if cls._sessions is None:
+                cls._sessions = SessionStore(cls._create)
+        return cls._sessions
+
+    @classmethod
+    def configure_sessions(cls, capacity: int = 256, ttl: Optional[float] = 1800.0) -> SessionStore:
+        # Replaces the store; existing session states are dropped.
+        with cls._instance_lock:
+            cls._sessions = SessionStore(cls._create, capacity, ttl)
+        return cls._sessions
+
+    def memory_usage(self) -> dict:
+        characters = self._roster.snapshot().values()
+        records = self._battle_log.records
+        approx = sum(_sizeof(ch) for ch in characters) + sum(sys.getsizeof(r) for r in records)
+        return {"characters": len(characters), "log_records": len(records), "approx_bytes": approx}
+
+    @property
+    def roster(self) -> Roster:
+        return self._roster
+
+    @property
+    def events(self) -> EventBus:
+        return self._events
+
+    @property
+    def battle_log(self) -> BattleLogger:
+        return self._battle_log
+
+    # -------- Two-slot view --------
+
     def set_character(self, slot, character):
-        if slot == 1:
-            self._char1 = character
-        else:
-            self._char2 = character
+        with self._slots_lock:
+            char_id = self._slots.get(slot)
+            if char_id is not None and char_id in self._roster:
+                self._roster.replace(char_id, character)
+            else:
+                self._slots[slot] = self._roster.add(character)
 
     def get_character(self, slot):
-        return self._char1 if slot == 1 else self._char2
+        char_id = self._slots.get(slot)
+        return None if char_id is None else self._roster.get(char_id)
+
+    def update_character(self, slot, fn: Callable):
+        char_id = self._slots.get(slot)
+        if char_id is None:
+            raise RuntimeError(f"No character in slot {slot}")
+        return self._roster.update(char_id, fn)
+
+    def slot_id(self, slot) -> Optional[int]:
+        return self._slots.get(slot)
+
+    def _slot_ids(self):
+        ids = (self._slots.get(1), self._slots.get(2))
+        if None in ids:
+            raise RuntimeError("Both slots must be loaded before a battle")
+        return ids
 
     def simulate_battle_realtime(self, ui_update_callback, sleep_time=0.7):
-        logs = []
-        ch1 = self._char1
-        ch2 = self._char2
+        ids = self._slot_ids()
+        ch1, ch2 = self._roster.reserve(ids)
+        try:
+            return run_realtime_battle(ch1, ch2, ui_update_callback, sleep_time, self._events)
+        finally:
+            self._roster.release(ids)
 
-        logs.append(f"Battle begins between {ch1.get_name()} and {ch2.get_name()}")
-        ui_update_callback(logs[-1], ch1.get_health(), ch2.get_health())
-        time.sleep(sleep_time)
+    async def simulate_battle_realtime_async(self, ui_update_callback, sleep_time=0.7):
+        ids = self._slot_ids()
+        ch1, ch2 = self._roster.reserve(ids)
+        try:
+            return await run_realtime_battle_async(ch1, ch2, ui_update_callback, sleep_time, self._events)
+        finally:
+            self._roster.release(ids)
 
-        turn = 0
-        while ch1.get_health() > 0 and ch2.get_health() > 0:
-            attacker = ch1 if turn % 2 == 0 else ch2
-            defender = ch2 if turn % 2 == 0 else ch1
+    async def iter_battle_realtime(self, sleep_time=0.7) -> AsyncIterator[Tuple[str, int, int]]:
+        ids = self._slot_ids()
+        ch1, ch2 = self._roster.reserve(ids)
+        try:
+            async for frame in iter_battle_frames(ch1, ch2, sleep_time, self._events):
+                yield frame
+        finally:
+            self._roster.release(ids)
 
-            damage = attacker.get_attack()
-            defender.take_damage(damage)
+    def simulate_battle_headless(self, collect_logs: bool = False, max_turns: Optional[int] = None) -> BattleResult:
+        ids = self._slot_ids()
+        ch1, ch2 = self._roster.reserve(ids)
+        try:
+            return run_headless_battle(ch1, ch2, collect_logs, max_turns)
+        finally:
+            self._roster.release(ids)
 
-            text = (
-                f"{attacker.get_name()} hits {defender.get_name()} "
-                f"for {damage} damage! (HP now {defender.get_health()})"
-            )
-            logs.append(text)
+    def simulate_battle_initiative(self, max_actions: Optional[int] = None) -> InitiativeResult:
+        # Speed decides how often each side acts; damage lands on the reserved fighters.
+        ids = self._slot_ids()
+        ch1, ch2 = self._roster.reserve(ids)
+        try:
+            return run_initiative_battle([ch1, ch2], teams=[1, 2], max_actions=max_actions)
+        finally:
+            self._roster.release(ids)
 
-            ui_update_callback(text, ch1.get_health(), ch2.get_health())
-            time.sleep(sleep_time)
+    def predict_battle(self, max_turns: Optional[int] = None) -> BattleResult:
+        return solve_battle(self.get_character(1), self.get_character(2), max_turns)
 
-            turn += 1
+    # -------- Arenas --------
 
-        winner = ch1 if ch1.get_health() > 0 else ch2
-        final_msg = f"Winner: {winner.get_name()}"
-        logs.append(final_msg)
+    def run_arena_battle(self, id1: int, id2: int, ui_update_callback=None, sleep_time: float = 0.0,
+                         collect_logs: bool = False, max_turns: Optional[int] = None) -> BattleResult:
+        ch1, ch2 = self._roster.reserve((id1, id2))
+        try:
+            if ui_update_callback is None:
+                return run_headless_battle(ch1, ch2, collect_logs, max_turns)
+            winner, logs = run_realtime_battle(ch1, ch2, ui_update_callback, sleep_time, self._events)
+            return BattleResult(1 if winner is ch1 else 2, len(logs) - 2,
+                                ch1.get_health(), ch2.get_health(), logs)
+        finally:
+            self._roster.release((id1, id2))
 
-        ui_update_callback(final_msg, ch1.get_health(), ch2.get_health())
+    async def run_arena_battle_async(self, id1: int, id2: int, ui_update_callback,
+                                     sleep_time: float = 0.7) -> BattleResult:
+        ch1, ch2 = self._roster.reserve((id1, id2))
+        try:
+            winner, logs = await run_realtime_battle_async(ch1, ch2, ui_update_callback, sleep_time, self._events)
+            return BattleResult(1 if winner is ch1 else 2, len(logs) - 2,
+                                ch1.get_health(), ch2.get_health(), logs)
+        finally:
+            self._roster.release((id1, id2))
 
-        return winner, logs
+    def submit_arena_battle(self, id1: int, id2: int, ui_update_callback=None, sleep_time: float = 0.0,
+                            collect_logs: bool = False, max_turns: Optional[int] = None) -> Future:
+        cls = type(self)
+        with cls._instance_lock:
+            if cls._arena_pool is None:
+                cls._arena_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="arena")
+        return cls._arena_pool.submit(
+            self.run_arena_battle, id1, id2, ui_update_callback, sleep_time, collect_logs, max_turns
+        )
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from domain.models.battle_result import BattleResult
+
+
+def run_headless_battle(ch1, ch2, collect_logs: bool = False, max_turns: Optional[int] = None) -> BattleResult:
+    # Same turn order and damage rules as simulate_battle_realtime, minus the
+    # sleeps and UI callbacks. Attack values are constant during a fight, so
+    # they are read once instead of walking the decorator chain every turn.
+    logs = [] if collect_logs else None
+    health1 = ch1.get_health
+    health2 = ch2.get_health
+    atk1 = ch1.get_attack()
+    atk2 = ch2.get_attack()
+
+    if logs is not None:
+        logs.append(f"Battle begins between {ch1.get_name()} and {ch2.get_name()}")
+
+    turn = 0
+    while health1() > 0 and health2() > 0:
+        if max_turns is not None and turn >= max_turns:
+            return BattleResult(0, turn, health1(), health2(), logs)
+
+        if turn % 2 == 0:
+            ch2.take_damage(atk1)
+            if logs is not None:
+                logs.append(
+                    f"{ch1.get_name()} hits {ch2.get_name()} "
+                    f"for {atk1} damage! (HP now {health2()})"
+                )
+        else:
+            ch1.take_damage(atk2)
+            if logs is not None:
+                logs.append(
+                    f"{ch2.get_name()} hits {ch1.get_name()} "
+                    f"for {atk2} damage! (HP now {health1()})"
+                )
+
+        turn += 1
+
+    winner_slot = 1 if health1() > 0 else 2
+    if logs is not None:
+        winner = ch1 if winner_slot == 1 else ch2
+        logs.append(f"Winner: {winner.get_name()}")
+
+    return BattleResult(winner_slot, turn, health1(), health2(), logs)
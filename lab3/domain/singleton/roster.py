@@ -0,0 +1,103 @@
+import threading
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+class Roster:
+    """Thread-safe character store indexed by id and by name."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ids = count(1)
+        self._by_id: Dict[int, object] = {}
+        self._names: Dict[int, str] = {}
+        # Dicts double as insertion-ordered sets of ids.
+        self._by_name: Dict[str, Dict[int, None]] = {}
+        self._busy: Dict[int, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, char_id: int) -> bool:
+        return char_id in self._by_id
+
+    def _index(self, char_id: int, character) -> None:
+        name = character.get_name()
+        self._by_id[char_id] = character
+        self._names[char_id] = name
+        self._by_name.setdefault(name, {})[char_id] = None
+
+    def _unindex(self, char_id: int) -> None:
+        name = self._names.pop(char_id)
+        del self._by_id[char_id]
+        ids = self._by_name[name]
+        del ids[char_id]
+        if not ids:
+            del self._by_name[name]
+
+    def _check_idle(self, char_id: int) -> None:
+        if char_id not in self._by_id:
+            raise KeyError(f"No character with id {char_id}")
+        if char_id in self._busy:
+            raise RuntimeError(f"Character {char_id} is in a battle")
+
+    def add(self, character) -> int:
+        with self._lock:
+            char_id = next(self._ids)
+            self._index(char_id, character)
+            return char_id
+
+    def get(self, char_id: int):
+        return self._by_id.get(char_id)
+
+    def get_by_name(self, name: str):
+        ids = self._by_name.get(name)
+        if not ids:
+            return None
+        return self._by_id.get(next(iter(ids)))
+
+    def ids_for_name(self, name: str) -> Tuple[int, ...]:
+        with self._lock:
+            return tuple(self._by_name.get(name, ()))
+
+    def replace(self, char_id: int, character) -> None:
+        with self._lock:
+            self._check_idle(char_id)
+            self._unindex(char_id)
+            self._index(char_id, character)
+
+    def update(self, char_id: int, fn: Callable):
+        # Read-modify-write under the lock, so concurrent buffs never lose an update.
+        with self._lock:
+            self._check_idle(char_id)
+            character = fn(self._by_id[char_id])
+            self._unindex(char_id)
+            self._index(char_id, character)
+            return character
+
+    def remove(self, char_id: int) -> None:
+        with self._lock:
+            self._check_idle(char_id)
+            self._unindex(char_id)
+
+    def reserve(self, char_ids: Iterable[int]) -> List:
+        # Marks fighters busy for the length of a battle so no other arena or
+        # session can fight or modify them meanwhile.
+        char_ids = list(char_ids)
+        with self._lock:
+            if len(set(char_ids)) != len(char_ids):
+                raise ValueError("A character cannot fight itself")
+            for char_id in char_ids:
+                self._check_idle(char_id)
+            for char_id in char_ids:
+                self._busy[char_id] = None
+            return [self._by_id[char_id] for char_id in char_ids]
+
+    def release(self, char_ids: Iterable[int]) -> None:
+        with self._lock:
+            for char_id in char_ids:
+                self._busy.pop(char_id, None)
+
+    def snapshot(self) -> Dict[int, object]:
+        with self._lock:
+            return dict(self._by_id)
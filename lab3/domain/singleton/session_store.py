@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SessionStore(Generic[T]):
+    """Bounded map of per-session state with LRU eviction and idle expiry.
+
+    Every lookup (get_or_create and get) moves a session to the most-recent
+    end, so recency order is also last-access order and expired sessions are
+    always at the front. Listing sessions or stats does not count as access.
+    """
+
+    def __init__(self, factory: Callable[[], T], capacity: int = 256, ttl: Optional[float] = 1800.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self._factory = factory
+        self._capacity = capacity
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+        self.evicted = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, session_id: Hashable) -> bool:
+        return session_id in self._entries
+
+    def _expire(self, now: float) -> None:
+        if self._ttl is None:
+            return
+        entries = self._entries
+        while entries:
+            session_id, (_, last_seen) = next(iter(entries.items()))
+            if now - last_seen < self._ttl:
+                break
+            del entries[session_id]
+            self.expired += 1
+
+    def get_or_create(self, session_id: Hashable) -> T:
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            entry = self._entries.get(session_id)
+            if entry is not None:
+                entry[1] = now
+                self._entries.move_to_end(session_id)
+                return entry[0]
+
+            state = self._factory()
+            self._entries[session_id] = [state, now]
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+            return state
+
+    def get(self, session_id: Hashable) -> Optional[T]:
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            entry[1] = now
+            self._entries.move_to_end(session_id)
+            return entry[0]
+
+    def discard(self, session_id: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def sessions(self) -> Dict[Hashable, T]:
+        with self._lock:
+            self._expire(self._clock())
+            return {session_id: state for session_id, (state, _) in self._entries.items()}
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._expire(self._clock())
+            states = [state for state, _ in self._entries.values()]
+            stats = {
+                "sessions": len(states),
+                "capacity": self._capacity,
+                "ttl": self._ttl,
+                "evicted": self.evicted,
+                "expired": self.expired,
+            }
+
+        # Per-state memory accounting runs outside the lock.
+        usages = [state.memory_usage() for state in states if hasattr(state, "memory_usage")]
+        for key in ("characters", "log_records", "approx_bytes"):
+            stats[key] = sum(usage.get(key, 0) for usage in usages)
+        return stats